@@ -5,6 +5,8 @@ Attack implementations for testing AI agent security.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from typing import Any
 
 from superclaw.attacks.base import Attack, AttackResult
@@ -44,6 +46,7 @@ async def _run_attack_async(
     techniques: list[str] | None = None,
     project_dir: str | None = None,
     adapter_config: dict[str, Any] | None = None,
+    concurrency: int = 1,
 ) -> dict[str, Any]:
     """Run attack asynchronously."""
     from superclaw.adapters import create_adapter
@@ -90,7 +93,10 @@ async def _run_attack_async(
         # Determine which techniques to use
         technique_names = techniques or list(ATTACK_REGISTRY.keys())
 
-        # Run attacks
+        # Collect (technique, payload) pairs, then dispatch the prompts with
+        # bounded concurrency. Responses are aggregated in dispatch order
+        # below, so running averages and evidence match a sequential run.
+        attack_payloads: list[tuple[str, str]] = []
         for technique_name in technique_names:
             if technique_name not in ATTACK_REGISTRY:
                 continue
@@ -100,50 +106,55 @@ async def _run_attack_async(
 
             # Generate attack payloads
             payloads = attack.generate_payloads()
-
             for payload in payloads[:5]:  # Limit payloads per technique
-                # Send attack payload
-                output = await adapter.send_prompt(payload)
-
-                # Evaluate against behaviors
-                for behavior_name in behavior_names:
-                    if behavior_name not in BEHAVIOR_REGISTRY:
-                        continue
-
-                    behavior = create_behavior(behavior_name)
-                    result = behavior.evaluate(output, context={})
-
-                    # Aggregate results
-                    if behavior_name not in results["behaviors"]:
-                        results["behaviors"][behavior_name] = {
-                            "passed": True,
-                            "score": 1.0,
-                            "evidence": [],
-                            "attempts": 0,
-                            "severity": result.severity.value,
-                        }
-
-                    behavior_results = results["behaviors"][behavior_name]
-                    behavior_results["attempts"] += 1
-
-                    if not result.passed:
-                        behavior_results["passed"] = False
-                        behavior_results["evidence"].extend(result.evidence)
-
-                    # Running average score
-                    n = behavior_results["attempts"]
-                    behavior_results["score"] = (
-                        behavior_results["score"] * (n - 1) + result.score
-                    ) / n
-
-                results["attacks"].append(
-                    {
-                        "technique": technique_name,
-                        "payload_preview": payload[:100],
-                        "response_length": len(output.response_text),
-                        "evidence_ledger": output.to_ledger(),
+                attack_payloads.append((technique_name, payload))
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def send(payload: str):
+            async with semaphore:
+                return await adapter.send_prompt(payload)
+
+        outputs = await asyncio.gather(*(send(payload) for _, payload in attack_payloads))
+
+        for (technique_name, payload), output in zip(attack_payloads, outputs):
+            # Evaluate against behaviors
+            for behavior_name in behavior_names:
+                if behavior_name not in BEHAVIOR_REGISTRY:
+                    continue
+
+                behavior = create_behavior(behavior_name)
+                result = behavior.evaluate(output, context={})
+
+                # Aggregate results
+                if behavior_name not in results["behaviors"]:
+                    results["behaviors"][behavior_name] = {
+                        "passed": True,
+                        "score": 1.0,
+                        "evidence": [],
+                        "attempts": 0,
+                        "severity": result.severity.value,
                     }
-                )
+
+                behavior_results = results["behaviors"][behavior_name]
+                behavior_results["attempts"] += 1
+
+                if not result.passed:
+                    behavior_results["passed"] = False
+                    behavior_results["evidence"].extend(result.evidence)
+
+                # Running average score
+                n = behavior_results["attempts"]
+                behavior_results["score"] = (behavior_results["score"] * (n - 1) + result.score) / n
+
+            results["attacks"].append(
+                {
+                    "technique": technique_name,
+                    "payload_preview": payload[:100],
+                    "response_length": len(output.response_text),
+                    "evidence_ledger": output.to_ledger(),
+                }
+            )
 
         # Calculate overall score
         if results["behaviors"]:
@@ -161,11 +172,12 @@ async def _run_attack_async(
 async def _run_evaluation_async(
     agent_type: str,
     target: str,
-    scenarios: list[dict] | None = None,
+    scenarios: Iterable[dict] | None = None,
     behaviors: list[str] | None = None,
     techniques: list[str] | None = None,
     project_dir: str | None = None,
     adapter_config: dict[str, Any] | None = None,
+    concurrency: int = 1,
 ) -> dict[str, Any]:
     """Run evaluation asynchronously, optionally using pre-generated scenarios."""
     from superclaw.adapters import create_adapter
@@ -210,9 +222,27 @@ async def _run_evaluation_async(
         if not scenarios:
             return results
 
-        for scenario in scenarios:
+        # Dispatch scenario prompts with bounded concurrency. Scenarios may
+        # arrive from a streaming parser, so tasks start while the source is
+        # still being read; aggregation below stays in scenario order.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def send(scenario: dict):
+            async with semaphore:
+                return await adapter.send_prompt(
+                    scenario.get("prompt", ""), context={"scenario": scenario}
+                )
+
+        scenario_list: list[dict] = []
+        tasks: list[asyncio.Task] = []
+        async with asyncio.TaskGroup() as tg:
+            for scenario in scenarios:
+                scenario_list.append(scenario)
+                tasks.append(tg.create_task(send(scenario)))
+        outputs = [task.result() for task in tasks]
+
+        for scenario, output in zip(scenario_list, outputs):
             prompt = scenario.get("prompt", "")
-            output = await adapter.send_prompt(prompt, context={"scenario": scenario})
 
             scenario_behavior_results: dict[str, Any] = {}
             scenario_scores: list[float] = []
@@ -292,6 +322,7 @@ def run_attack(
     techniques: list[str] | None = None,
     project_dir: str | None = None,
     adapter_config: dict[str, Any] | None = None,
+    concurrency: int = 1,
 ) -> dict[str, Any]:
     """
     Run attack against an agent.
@@ -302,12 +333,12 @@ def run_attack(
         behaviors: Behaviors to test (None = all)
         techniques: Attack techniques to use (None = all)
         project_dir: Project directory for ACP agents
+        concurrency: Prompts in flight at once. Keep at 1 for stateful
+            adapters whose responses depend on conversation order.
 
     Returns:
         Attack results dictionary
     """
-    import asyncio
-
     return asyncio.run(
         _run_attack_async(
             agent_type=agent_type,
@@ -316,6 +347,7 @@ def run_attack(
             techniques=techniques,
             project_dir=project_dir,
             adapter_config=adapter_config,
+            concurrency=concurrency,
         )
     )
 
@@ -323,18 +355,17 @@ def run_attack(
 def run_evaluation(
     agent_type: str,
     target: str,
-    scenarios: list[dict] | None = None,
+    scenarios: Iterable[dict] | None = None,
     behaviors: list[str] | None = None,
     techniques: list[str] | None = None,
     adapter_config: dict[str, Any] | None = None,
+    concurrency: int = 1,
 ) -> dict[str, Any]:
     """
     Run evaluation against an agent.
 
     Similar to run_attack but with optional pre-generated scenarios.
     """
-    import asyncio
-
     if scenarios:
         return asyncio.run(
             _run_evaluation_async(
@@ -344,6 +375,7 @@ def run_evaluation(
                 behaviors=behaviors,
                 techniques=techniques,
                 adapter_config=adapter_config,
+                concurrency=concurrency,
             )
         )
 
@@ -353,6 +385,7 @@ def run_evaluation(
         behaviors=behaviors,
         techniques=techniques,
         adapter_config=adapter_config,
+        concurrency=concurrency,
     )
 
 
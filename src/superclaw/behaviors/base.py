@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -20,6 +21,36 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
+class EvidenceLog:
+    """
+    Bounded evidence accumulator for behavior evaluations.
+
+    Caps stored evidence at ``maxlen`` entries so adversarial inputs
+    (e.g. thousands of bad tool calls) cannot grow memory without bound.
+    Appends past the cap are counted in ``overflow`` instead of stored.
+    """
+
+    __slots__ = ("_items", "overflow")
+
+    def __init__(self, maxlen: int = 50):
+        self._items: deque[str] = deque(maxlen=maxlen)
+        self.overflow = 0
+
+    def append(self, item: str) -> None:
+        """Record an evidence string, or count it as overflow once full."""
+        if len(self._items) < (self._items.maxlen or 0):
+            self._items.append(item)
+        else:
+            self.overflow += 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def to_list(self) -> list[str]:
+        """Return the stored evidence as a plain list."""
+        return list(self._items)
+
+
 @dataclass
 class BehaviorResult:
     """Result of behavior evaluation."""
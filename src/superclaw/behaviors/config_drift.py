@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from superclaw.behaviors.base import BehaviorContract, BehaviorResult, BehaviorSpec, Severity
+from superclaw.behaviors.base import (
+    BehaviorContract,
+    BehaviorResult,
+    BehaviorSpec,
+    EvidenceLog,
+    Severity,
+)
 
 if TYPE_CHECKING:
     from superclaw.adapters.base import AgentOutput
@@ -95,7 +101,7 @@ class ConfigurationDriftDetection(BehaviorSpec):
     ) -> BehaviorResult:
         """Evaluate configuration drift."""
         context = context or {}
-        evidence = []
+        evidence = EvidenceLog()
         drifts = 0
         warnings = 0
 
@@ -169,12 +175,13 @@ class ConfigurationDriftDetection(BehaviorSpec):
             behavior_name=self.get_name(),
             passed=passed,
             score=score,
-            evidence=evidence,
+            evidence=evidence.to_list(),
             severity=Severity.MEDIUM if drifts > 0 else Severity.LOW,
             metadata={
                 "drifts": drifts,
                 "warnings": warnings,
                 "immutable_keys_checked": len(self.IMMUTABLE_KEYS),
                 "sensitive_keys_checked": len(self.SENSITIVE_KEYS),
+                "evidence_overflow": evidence.overflow,
             },
         )
@@ -5,7 +5,13 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from superclaw.behaviors.base import BehaviorContract, BehaviorResult, BehaviorSpec, Severity
+from superclaw.behaviors.base import (
+    BehaviorContract,
+    BehaviorResult,
+    BehaviorSpec,
+    EvidenceLog,
+    Severity,
+)
 
 if TYPE_CHECKING:
     from superclaw.adapters.base import AgentOutput
@@ -96,7 +102,7 @@ class PromptInjectionResistance(BehaviorSpec):
     ) -> BehaviorResult:
         """Evaluate agent's resistance to injection attacks."""
         context = context or {}
-        evidence = []
+        evidence = EvidenceLog()
         issues_found = 0
 
         # Check injection attempts in output
@@ -151,11 +157,12 @@ class PromptInjectionResistance(BehaviorSpec):
             behavior_name=self.get_name(),
             passed=passed,
             score=score,
-            evidence=evidence,
+            evidence=evidence.to_list(),
             severity=Severity.CRITICAL if not passed else Severity.LOW,
             metadata={
                 "injection_attempts": len(injection_attempts),
                 "issues_found": issues_found,
                 "blocked_count": sum(1 for a in injection_attempts if a.get("blocked", False)),
+                "evidence_overflow": evidence.overflow,
             },
         )
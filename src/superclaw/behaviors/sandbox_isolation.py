@@ -5,7 +5,13 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from superclaw.behaviors.base import BehaviorContract, BehaviorResult, BehaviorSpec, Severity
+from superclaw.behaviors.base import (
+    BehaviorContract,
+    BehaviorResult,
+    BehaviorSpec,
+    EvidenceLog,
+    Severity,
+)
 
 if TYPE_CHECKING:
     from superclaw.adapters.base import AgentOutput
@@ -97,7 +103,7 @@ class SandboxIsolation(BehaviorSpec):
     ) -> BehaviorResult:
         """Evaluate sandbox isolation."""
         context = context or {}
-        evidence = []
+        evidence = EvidenceLog()
         violations = 0
 
         workspace = context.get("workspace", "~/.openclaw/workspace")
@@ -162,12 +168,13 @@ class SandboxIsolation(BehaviorSpec):
             behavior_name=self.get_name(),
             passed=passed,
             score=score,
-            evidence=evidence,
+            evidence=evidence.to_list(),
             severity=Severity.CRITICAL if not passed else Severity.LOW,
             metadata={
                 "total_accesses": len(access_log),
                 "tool_calls": len(tool_calls),
                 "violations": violations,
                 "workspace": workspace,
+                "evidence_overflow": evidence.overflow,
             },
         )
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from superclaw.behaviors.base import BehaviorContract, BehaviorResult, BehaviorSpec, Severity
+from superclaw.behaviors.base import (
+    BehaviorContract,
+    BehaviorResult,
+    BehaviorSpec,
+    EvidenceLog,
+    Severity,
+)
 
 if TYPE_CHECKING:
     from superclaw.adapters.base import AgentOutput
@@ -68,7 +74,7 @@ class SessionBoundaryIntegrity(BehaviorSpec):
     ) -> BehaviorResult:
         """Evaluate session boundary integrity."""
         context = context or {}
-        evidence = []
+        evidence = EvidenceLog()
         violations = 0
 
         current_session = context.get("session_id", "")
@@ -138,7 +144,7 @@ class SessionBoundaryIntegrity(BehaviorSpec):
             behavior_name=self.get_name(),
             passed=passed,
             score=score,
-            evidence=evidence,
+            evidence=evidence.to_list(),
             severity=Severity.HIGH if not passed else Severity.LOW,
             metadata={
                 "acp_messages": len(acp_messages),
@@ -146,5 +152,6 @@ class SessionBoundaryIntegrity(BehaviorSpec):
                 "violations": violations,
                 "current_session": current_session,
                 "send_policy": send_policy,
+                "evidence_overflow": evidence.overflow,
             },
         )
@@ -1,12 +1,38 @@
-from superclaw.bloom.ideation import IdeationEngine
-from superclaw.bloom.judgment import JudgmentEngine
-from superclaw.bloom.rollout import RolloutEngine
-from superclaw.bloom.scenarios import generate_scenarios, load_scenarios
+"""Bloom pipeline engines, loaded lazily to keep package import cheap."""
+
+from typing import Any
 
 __all__ = [
     "generate_scenarios",
     "load_scenarios",
     "IdeationEngine",
     "RolloutEngine",
+    "CachingAdapter",
     "JudgmentEngine",
+    "run_pipeline",
+    "arun_pipeline",
 ]
+
+# PEP 562 lazy loading: importing superclaw.bloom no longer pulls in the
+# engines (and litellm) eagerly; each submodule loads on first attribute use.
+_SUBMODULES = {
+    "IdeationEngine": "ideation",
+    "RolloutEngine": "rollout",
+    "CachingAdapter": "rollout",
+    "JudgmentEngine": "judgment",
+    "generate_scenarios": "scenarios",
+    "load_scenarios": "scenarios",
+    "run_pipeline": "pipeline",
+    "arun_pipeline": "pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f"superclaw.bloom.{_SUBMODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
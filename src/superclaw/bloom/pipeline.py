@@ -0,0 +1,107 @@
+"""Overlapped ideation → rollout → judgment pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from superclaw.bloom.ideation import IdeationEngine
+from superclaw.bloom.judgment import JudgmentEngine, JudgmentResult
+from superclaw.bloom.rollout import RolloutEngine
+
+
+def _chunk_sizes(total: int, chunks: int) -> list[int]:
+    """Split total into at most chunks near-equal positive parts."""
+    chunks = max(1, min(chunks, total))
+    base, extra = divmod(total, chunks)
+    return [base + (1 if i < extra else 0) for i in range(chunks)]
+
+
+def run_pipeline(
+    ideation: IdeationEngine,
+    rollout: RolloutEngine,
+    judgment: JudgmentEngine,
+    behavior: str,
+    num_scenarios: int,
+    variation_dimensions: list[str] | None = None,
+    template: dict[str, Any] | None = None,
+    chunks: int = 4,
+) -> list[JudgmentResult]:
+    """Synchronous wrapper around :func:`arun_pipeline`."""
+    return asyncio.run(
+        arun_pipeline(
+            ideation,
+            rollout,
+            judgment,
+            behavior,
+            num_scenarios,
+            variation_dimensions,
+            template,
+            chunks,
+        )
+    )
+
+
+async def arun_pipeline(
+    ideation: IdeationEngine,
+    rollout: RolloutEngine,
+    judgment: JudgmentEngine,
+    behavior: str,
+    num_scenarios: int,
+    variation_dimensions: list[str] | None = None,
+    template: dict[str, Any] | None = None,
+    chunks: int = 4,
+) -> list[JudgmentResult]:
+    """Run ideation, rollout, and judgment as one overlapped pipeline.
+
+    Instead of finishing each stage before starting the next, ideation is
+    split into near-equal chunks generated concurrently; every scenario
+    starts rolling out as soon as its chunk arrives, and every rollout is
+    judged as soon as it completes. End-to-end wall clock approaches the
+    slowest single stage plus pipeline fill, rather than the sum of all
+    three stages.
+
+    Args:
+        ideation: Engine that generates the attack scenarios.
+        rollout: Engine that executes scenarios against the adapter.
+        judgment: Engine that scores the rollout results.
+        behavior: The security behavior being tested.
+        num_scenarios: Total number of scenarios to generate.
+        variation_dimensions: Dimensions to apply variations.
+        template: Base template for the behavior; defaults to the built-in
+            template for the given behavior.
+        chunks: Number of concurrent ideation calls to split generation into.
+
+    Returns:
+        List of JudgmentResult objects, in scenario production order.
+    """
+    if variation_dimensions is None:
+        variation_dimensions = []
+    if template is None:
+        from superclaw.bloom.scenarios import BEHAVIOR_TEMPLATES
+
+        if behavior not in BEHAVIOR_TEMPLATES:
+            raise ValueError(
+                f"Unknown behavior: {behavior}. Available: {list(BEHAVIOR_TEMPLATES.keys())}"
+            )
+        template = BEHAVIOR_TEMPLATES[behavior]
+
+    rollout_semaphore = asyncio.Semaphore(rollout.concurrency)
+    judgment_tasks: list[asyncio.Task[JudgmentResult]] = []
+
+    async def run_one(scenario: dict[str, Any]) -> JudgmentResult:
+        async with rollout_semaphore:
+            rollout_result = await rollout.execute_single(scenario)
+        judged = await judgment.aevaluate([rollout_result])
+        return judged[0]
+
+    async def produce(chunk_size: int) -> None:
+        scenarios = await ideation.agenerate(behavior, chunk_size, variation_dimensions, template)
+        for scenario in scenarios:
+            judgment_tasks.append(tg.create_task(run_one(scenario)))
+
+    async with asyncio.TaskGroup() as tg:
+        for size in _chunk_sizes(num_scenarios, chunks):
+            tg.create_task(produce(size))
+
+    return [task.result() for task in judgment_tasks]
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import time
-from dataclasses import dataclass, field
+from collections.abc import Awaitable, Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
 from typing import Any, Protocol
 
+from aiolimiter import AsyncLimiter
+
 
 class AgentAdapter(Protocol):
     """Protocol for agent adapters that can process prompts."""
@@ -16,7 +21,46 @@ class AgentAdapter(Protocol):
         ...
 
 
-@dataclass
+class CachingAdapter:
+    """Opt-in disk cache around any :class:`AgentAdapter`.
+
+    Audit re-runs hit the adapter with prompts identical to the previous
+    run; wrapping the adapter makes those replays free, which matters for
+    CI/regression testing. Keys are content hashes of the prompt, so the
+    cache survives process restarts and is safe to share across runs.
+    Requires diskcache.
+    """
+
+    def __init__(self, inner: AgentAdapter, cache_path: str, ttl: float = 86400) -> None:
+        """Initialize the CachingAdapter.
+
+        Args:
+            inner: The adapter whose responses are cached.
+            cache_path: Directory for the disk-backed response cache.
+            ttl: Expiry in seconds for cached responses.
+        """
+        try:
+            import diskcache
+        except ImportError as e:
+            raise RuntimeError(
+                "diskcache not installed. Install with: pip install diskcache"
+            ) from e
+        self.inner = inner
+        self.ttl = ttl
+        self._cache = diskcache.Cache(cache_path)
+
+    async def process(self, prompt: str) -> str:
+        """Return the cached response for prompt, calling inner on a miss."""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        output = await self.inner.process(prompt)
+        self._cache.set(key, output, expire=self.ttl)
+        return output
+
+
+@dataclass(slots=True)
 class RolloutResult:
     """Result from executing a single scenario."""
 
@@ -53,6 +97,8 @@ class RolloutEngine:
         adapter: AgentAdapter,
         concurrency: int = 5,
         timeout: float = 60.0,
+        dedupe: bool = False,
+        requests_per_minute: int | None = None,
     ) -> None:
         """Initialize the RolloutEngine.
 
@@ -60,10 +106,22 @@ class RolloutEngine:
             adapter: The agent adapter to test.
             concurrency: Maximum number of concurrent scenario executions.
             timeout: Timeout in seconds for each scenario execution.
+            dedupe: Execute each unique prompt once and fan the result out
+                to all scenarios sharing it. Opt-in, since stateful adapters
+                may legitimately respond differently to repeated prompts.
+            requests_per_minute: Optional cap on adapter calls per minute. A
+                token-bucket limiter smooths call bursts so rate-limited
+                backends do not answer with 429s that serialize the run
+                through retries.
         """
         self.adapter = adapter
         self.concurrency = concurrency
         self.timeout = timeout
+        self.dedupe = dedupe
+        self.requests_per_minute = requests_per_minute
+        self._rate_limiter = (
+            AsyncLimiter(requests_per_minute, 60) if requests_per_minute else nullcontext()
+        )
 
     def execute(
         self,
@@ -85,16 +143,100 @@ class RolloutEngine:
     ) -> list[RolloutResult]:
         """Execute scenarios asynchronously with concurrency control.
 
+        A fixed pool of worker tasks pulls scenarios from a queue, so only
+        O(concurrency) tasks are alive at once instead of one pre-built
+        coroutine per scenario, and the TaskGroup gives structured
+        cancellation if a worker fails hard.
+
         Args:
             scenarios: List of scenario dictionaries to execute.
 
         Returns:
-            List of RolloutResult objects.
+            List of RolloutResult objects in input order.
+        """
+        if self.dedupe:
+            return await self._aexecute_deduped(scenarios)
+        return await self._aexecute_pool(scenarios)
+
+    async def _aexecute_pool(
+        self,
+        scenarios: list[dict[str, Any]],
+    ) -> list[RolloutResult]:
+        """Run scenarios through the bounded worker pool."""
+        queue: asyncio.Queue[tuple[int, dict[str, Any]]] = asyncio.Queue()
+        for item in enumerate(scenarios):
+            queue.put_nowait(item)
+
+        results: list[RolloutResult | None] = [None] * len(scenarios)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index, scenario = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[index] = await self._execute_scenario(scenario)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(max(1, min(self.concurrency, len(scenarios)))):
+                tg.create_task(worker())
+
+        return [result for result in results if result is not None]
+
+    async def _aexecute_deduped(
+        self,
+        scenarios: list[dict[str, Any]],
+    ) -> list[RolloutResult]:
+        """Execute each unique prompt once and fan results back out.
+
+        Scenarios sharing a prompt (empty variation dims, LLM collisions)
+        get clones of the single execution, re-stamped with their own
+        scenario id and metadata.
+        """
+        by_prompt: dict[str, list[int]] = {}
+        for index, scenario in enumerate(scenarios):
+            by_prompt.setdefault(scenario.get("prompt", ""), []).append(index)
+
+        unique = [scenarios[indices[0]] for indices in by_prompt.values()]
+        unique_results = await self._aexecute_pool(unique)
+
+        results: list[RolloutResult | None] = [None] * len(scenarios)
+        for base, indices in zip(unique_results, by_prompt.values()):
+            for index in indices:
+                scenario = scenarios[index]
+                metadata = dict(base.metadata)
+                metadata["behavior"] = scenario.get("behavior")
+                if base.success:
+                    metadata["difficulty"] = scenario.get("difficulty")
+                    metadata["expected_behavior"] = scenario.get("expected_behavior")
+                results[index] = replace(
+                    base,
+                    scenario_id=scenario.get("id", "unknown"),
+                    metadata=metadata,
+                )
+
+        return [result for result in results if result is not None]
+
+    def aiter_execute(
+        self,
+        scenarios: list[dict[str, Any]],
+    ) -> Iterator[Awaitable[RolloutResult]]:
+        """Execute scenarios, yielding results as they complete.
+
+        Unlike :meth:`aexecute`, which only returns once the whole batch has
+        finished, this streams completed rollouts so downstream stages (e.g.
+        judgment) can start while other scenarios are still in flight.
+
+        Args:
+            scenarios: List of scenario dictionaries to execute.
+
+        Returns:
+            Iterator of awaitables yielding RolloutResult in completion order.
         """
         semaphore = asyncio.Semaphore(self.concurrency)
-        tasks = [self._execute_with_semaphore(semaphore, scenario) for scenario in scenarios]
-        results = await asyncio.gather(*tasks)
-        return list(results)
+        return asyncio.as_completed(
+            [self._execute_with_semaphore(semaphore, scenario) for scenario in scenarios]
+        )
 
     async def _execute_with_semaphore(
         self,
@@ -119,60 +261,43 @@ class RolloutEngine:
         """
         scenario_id = scenario.get("id", "unknown")
         prompt = scenario.get("prompt", "")
+        # Wall-clock stamp for reporting; duration comes from the monotonic
+        # perf counter so it cannot be skewed by clock adjustments.
         start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        try:
-            output = await asyncio.wait_for(
-                self.adapter.process(prompt),
-                timeout=self.timeout,
-            )
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
-
-            return RolloutResult(
-                scenario_id=scenario_id,
-                prompt=prompt,
-                output=output,
-                start_time=start_time,
-                end_time=end_time,
-                duration_ms=duration_ms,
-                success=True,
-                metadata={
-                    "behavior": scenario.get("behavior"),
-                    "difficulty": scenario.get("difficulty"),
-                    "expected_behavior": scenario.get("expected_behavior"),
-                },
-            )
+        output = ""
+        error: str | None = None
+        success = True
+        metadata: dict[str, Any] = {"behavior": scenario.get("behavior")}
 
+        try:
+            async with self._rate_limiter:
+                output = await asyncio.wait_for(
+                    self.adapter.process(prompt),
+                    timeout=self.timeout,
+                )
+            metadata["difficulty"] = scenario.get("difficulty")
+            metadata["expected_behavior"] = scenario.get("expected_behavior")
         except TimeoutError:
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
-            return RolloutResult(
-                scenario_id=scenario_id,
-                prompt=prompt,
-                output="",
-                start_time=start_time,
-                end_time=end_time,
-                duration_ms=duration_ms,
-                success=False,
-                error=f"Timeout after {self.timeout}s",
-                metadata={"behavior": scenario.get("behavior")},
-            )
-
+            success = False
+            error = f"Timeout after {self.timeout}s"
         except Exception as e:
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
-            return RolloutResult(
-                scenario_id=scenario_id,
-                prompt=prompt,
-                output="",
-                start_time=start_time,
-                end_time=end_time,
-                duration_ms=duration_ms,
-                success=False,
-                error=str(e),
-                metadata={"behavior": scenario.get("behavior")},
-            )
+            success = False
+            error = str(e)
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        return RolloutResult(
+            scenario_id=scenario_id,
+            prompt=prompt,
+            output=output,
+            start_time=start_time,
+            end_time=start_time + duration_ms / 1000,
+            duration_ms=duration_ms,
+            success=success,
+            error=error,
+            metadata=metadata,
+        )
 
     async def execute_single(
         self,
@@ -80,12 +80,25 @@ BEHAVIOR_TEMPLATES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Serialize the static template fragments once at import time so repeated
+# generate_scenarios calls skip per-call json.dumps in the prompt builder.
+for _template in BEHAVIOR_TEMPLATES.values():
+    _template["_base_prompts_json"] = json.dumps(_template["base_prompts"], indent=2)
+    _template["_actions_json"] = json.dumps(_template["actions"], indent=2)
+del _template
+
+# Minimum generation size worth routing through the provider batch API.
+_BATCH_MIN_SCENARIOS = 20
+
 
 def generate_scenarios(
     behavior: str,
     num_scenarios: int,
     variation_dimensions: list[str] | None = None,
     model: str = "gpt-4o-mini",
+    batch: bool = False,
+    poll_interval: float = 30.0,
+    prompt_cache: bool = True,
 ) -> list[dict[str, Any]]:
     """Generate security test scenarios for a given behavior.
 
@@ -94,6 +107,11 @@ def generate_scenarios(
         num_scenarios: Number of scenarios to generate.
         variation_dimensions: Dimensions to vary (e.g., ["noise", "emotional_pressure"]).
         model: LiteLLM model identifier to use for ideation.
+        batch: Route large generations through the provider batch API
+            (~50% cheaper, exempt from rate limits, minutes of latency).
+            Only takes effect for at least 20 scenarios.
+        poll_interval: Seconds between batch status polls.
+        prompt_cache: Mark the static system prompt as provider-cacheable.
 
     Returns:
         List of scenario dictionaries with id, prompt, expected_behavior, difficulty.
@@ -106,16 +124,23 @@ def generate_scenarios(
             f"Unknown behavior: {behavior}. Available: {list(BEHAVIOR_TEMPLATES.keys())}"
         )
 
-    engine = IdeationEngine(model=model)
-    scenarios = engine.generate(
+    engine = IdeationEngine(model=model, prompt_cache=prompt_cache)
+    if batch and num_scenarios >= _BATCH_MIN_SCENARIOS:
+        return engine.generate_batch(
+            behavior=behavior,
+            num_scenarios=num_scenarios,
+            variation_dimensions=variation_dimensions,
+            template=BEHAVIOR_TEMPLATES[behavior],
+            poll_interval=poll_interval,
+        )
+
+    return engine.generate(
         behavior=behavior,
         num_scenarios=num_scenarios,
         variation_dimensions=variation_dimensions,
         template=BEHAVIOR_TEMPLATES[behavior],
     )
 
-    return scenarios
-
 
 def load_scenarios(path: str) -> list[dict[str, Any]]:
     """Load scenarios from a JSON file.
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
 import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import orjson
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
@@ -15,7 +23,16 @@ app = typer.Typer(
     help="🦞 SuperClaw - Break AI coding agents with style",
     no_args_is_help=True,
 )
-console = Console()
+# When stdout is a pipe or file, skip ANSI styling and the regex-based
+# auto-highlighter entirely; markup tags are still parsed (and dropped)
+# so redirected output stays clean. SUPERCLAW_COLOR=1 forces full
+# rendering for tools that capture ANSI deliberately.
+if os.environ.get("SUPERCLAW_COLOR") == "1":
+    console = Console(force_terminal=True)
+elif sys.stdout.isatty():
+    console = Console()
+else:
+    console = Console(highlight=False, color_system=None)
 error_console = Console(stderr=True)
 
 # Sub-command groups
@@ -36,6 +53,128 @@ app.add_typer(codeoptix_app, name="codeoptix")
 app.add_typer(scan_app, name="scan")
 
 
+# Computed once at import: Path.home() costs environment and passwd
+# lookups that need not repeat per command invocation.
+_CONFIG_DIR = Path.home() / ".superclaw"
+_CONFIG_FILE = _CONFIG_DIR / "config.yaml"
+_DEFAULT_CONFIG = str(_CONFIG_FILE)
+
+# Shared option defaults and help strings, defined once instead of being
+# re-allocated inside every typer.Option call.
+_DEFAULT_TARGET = "ws://127.0.0.1:18789"
+_H_TARGET = "OpenClaw gateway URL"
+_H_BEHAVIORS = "Comma-separated behaviors to test"
+_H_TECHNIQUES = "Attack techniques to use"
+_H_OUTPUT = "Output file for results"
+_H_OUTPUT_JSON = "Write JSON results to file"
+_H_SCENARIOS = "Scenarios JSON file"
+_H_MOCK_RESPONSE = "Mock response text (can be provided multiple times)"
+_H_ECHO_PROMPT = "Append the prompt to the mock response"
+_H_SIMULATE_INJECTION = "Simulate a successful injection attempt"
+_H_CONCURRENCY = "Prompts in flight at once (keep 1 for stateful agents)"
+_H_PLAIN = "Tab-separated output, bypassing table rendering"
+
+# Splits "a, b ,c" in one C-level pass, eating the surrounding whitespace.
+_CSV_RE = re.compile(r"\s*,\s*")
+
+# Modules resolved by _lazy, keyed by dotted path. Commands import their
+# dependencies on first use so cold start stays cheap, but repeated
+# invocations (REPL, test loops) skip the import machinery entirely.
+_LAZY_MODULES: dict[str, Any] = {}
+
+
+def _dump_json(obj: Any, path: str) -> None:
+    """Write obj to path as indented JSON in one serialize-and-write pass.
+
+    orjson serializes multi-MB result dumps several times faster than the
+    stdlib encoder and emits bytes directly, with str() as the fallback for
+    non-JSON types (Path, datetime, enums). Writing the encoded buffer
+    through a raw fd skips the buffered-IO wrapper and lands the dump in
+    one write syscall.
+    """
+    buf = orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf)
+    finally:
+        os.close(fd)
+
+
+def _finalize(results: dict, output: str | None, displayer) -> None:
+    """Display results and write them to output when requested.
+
+    Every attack/evaluate command ends with the same display-then-save
+    epilogue; keeping it in one place means one serialization path to tune.
+    """
+    displayer(results)
+    if output:
+        _dump_json(results, output)
+        console.print(f"\n[green]✓ Results saved to {output}[/green]")
+
+
+def _load_json(path: str | Path) -> Any:
+    """Read and parse a JSON file in one pass.
+
+    Typed decoding (msgspec Structs) was considered for the results and
+    scenarios files, but everything downstream — run_evaluation,
+    compare_runs, the report generators — consumes plain dicts, so a typed
+    parse would just pay a dict round-trip; untyped msgspec decodes no
+    faster than orjson.
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+# Scenario files above this size are streamed item-by-item when ijson is
+# available, so evaluation starts dispatching prompts before the whole
+# document has been parsed.
+_STREAM_PARSE_BYTES = 1 << 20
+
+
+def _load_scenarios_file(path: str | Path) -> Any:
+    """Load a scenarios JSON array, streaming it lazily for large files.
+
+    Falls back to an in-memory parse for small files or when the optional
+    ijson dependency is not installed.
+    """
+    if Path(path).stat().st_size > _STREAM_PARSE_BYTES:
+        try:
+            import ijson
+        except ImportError:
+            pass
+        else:
+            return ijson.items(open(path, "rb"), "item")
+    return _load_json(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_csv(value: str) -> tuple[str, ...] | None:
+    """Parse a comma-separated option value, treating "all" as no filter.
+
+    Cached so repeated invocations with the same selectors (CI matrices,
+    test loops) skip the re-split and re-allocation.
+    """
+    if value == "all":
+        return None
+    return tuple(_CSV_RE.split(value.strip()))
+
+
+def _lazy(path: str, attr: str) -> Any:
+    """Return attr from the module at path, importing it at most once."""
+    module = _LAZY_MODULES.get(path)
+    if module is None:
+        module = _LAZY_MODULES[path] = importlib.import_module(path)
+    return getattr(module, attr)
+
+
+def _banner(title: str, border_style: str, *fields: str) -> None:
+    """Render a command banner (panel plus detail lines) in one print call.
+
+    Each console.print is a full layout/render/flush cycle; grouping the
+    panel and its detail lines collapses the banner to a single pass.
+    """
+    console.print(Group(Panel.fit(title, border_style=border_style), *fields, ""))
+
+
 def handle_error(message: str, exception: Exception | None = None) -> None:
     """Display error message and exit."""
     error_console.print(f"[bold red]Error:[/bold red] {message}")
@@ -51,53 +190,45 @@ def handle_error(message: str, exception: Exception | None = None) -> None:
 
 @attack_app.command("openclaw")
 def attack_openclaw(
-    target: str = typer.Option(
-        "ws://127.0.0.1:18789", "--target", "-t", help="OpenClaw gateway URL"
-    ),
-    behaviors: str = typer.Option(
-        "all", "--behaviors", "-b", help="Comma-separated behaviors to test"
-    ),
-    techniques: str = typer.Option("all", "--techniques", help="Attack techniques to use"),
-    output: str | None = typer.Option(None, "--output", "-o", help="Output file for results"),
+    target: str = typer.Option(_DEFAULT_TARGET, "--target", "-t", help=_H_TARGET),
+    behaviors: str = typer.Option("all", "--behaviors", "-b", help=_H_BEHAVIORS),
+    techniques: str = typer.Option("all", "--techniques", help=_H_TECHNIQUES),
+    output: str | None = typer.Option(None, "--output", "-o", help=_H_OUTPUT),
+    concurrency: int = typer.Option(1, "--concurrency", help=_H_CONCURRENCY),
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be done without executing"
     ),
 ):
     """Attack an OpenClaw agent."""
-    console.print(
-        Panel.fit(
-            "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]OpenClaw[/bold cyan]",
-            border_style="red",
-        )
-    )
-    console.print(f"  Target: [cyan]{target}[/cyan]")
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
-    console.print(f"  Techniques: [yellow]{techniques}[/yellow]")
-    console.print()
-
     if dry_run:
-        console.print("[dim]Dry run mode - no attacks executed[/dim]")
+        # Plain print, before any Rich work: dry runs are the hot path when
+        # CI enumerates targets, and nothing below will execute anyway.
+        print(f"Dry run - no attacks executed (target={target}, behaviors={behaviors})")
         return
 
+    _banner(
+        "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]OpenClaw[/bold cyan]",
+        "red",
+        f"  Target: [cyan]{target}[/cyan]",
+        f"  Behaviors: [yellow]{behaviors}[/yellow]",
+        f"  Techniques: [yellow]{techniques}[/yellow]",
+    )
+
     try:
-        from superclaw.attacks import run_attack
+        run_attack = _lazy("superclaw.attacks", "run_attack")
 
-        behavior_list = behaviors.split(",") if behaviors != "all" else None
-        technique_list = techniques.split(",") if techniques != "all" else None
+        behavior_list = _parse_csv(behaviors)
+        technique_list = _parse_csv(techniques)
 
         results = run_attack(
             agent_type="openclaw",
             target=target,
             behaviors=behavior_list,
             techniques=technique_list,
+            concurrency=concurrency,
         )
 
-        _display_attack_results(results)
-
-        if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            console.print(f"\n[green]✓ Results saved to {output}[/green]")
+        _finalize(results, output, _display_attack_results)
     except ConnectionError as e:
         handle_error(f"Failed to connect to target: {target}", e)
     except Exception as e:
@@ -112,74 +243,60 @@ def attack_acp(
     project: str = typer.Option(".", "--project", "-p", help="Project directory"),
     behaviors: str = typer.Option("all", "--behaviors", "-b", help="Comma-separated behaviors"),
     output: str | None = typer.Option(None, "--output", "-o", help="Output file"),
+    concurrency: int = typer.Option(1, "--concurrency", help=_H_CONCURRENCY),
 ):
     """Attack any ACP-compatible agent."""
-    console.print(
-        Panel.fit(
-            "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]ACP Agent[/bold cyan]",
-            border_style="red",
-        )
+    _banner(
+        "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]ACP Agent[/bold cyan]",
+        "red",
+        f"  Command: [cyan]{command}[/cyan]",
+        f"  Project: [yellow]{project}[/yellow]",
+        f"  Behaviors: [yellow]{behaviors}[/yellow]",
     )
-    console.print(f"  Command: [cyan]{command}[/cyan]")
-    console.print(f"  Project: [yellow]{project}[/yellow]")
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
-    console.print()
 
     try:
-        from superclaw.attacks import run_attack
+        run_attack = _lazy("superclaw.attacks", "run_attack")
 
-        behavior_list = behaviors.split(",") if behaviors != "all" else None
+        behavior_list = _parse_csv(behaviors)
 
         results = run_attack(
             agent_type="acp",
             target=command,
             project_dir=project,
             behaviors=behavior_list,
+            concurrency=concurrency,
         )
 
-        _display_attack_results(results)
-
-        if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            console.print(f"\n[green]✓ Results saved to {output}[/green]")
+        _finalize(results, output, _display_attack_results)
     except Exception as e:
         handle_error("ACP attack failed", e)
 
 
 @attack_app.command("mock")
 def attack_mock(
-    mock_response: list[str] = typer.Option(
-        [], "--mock-response", help="Mock response text (can be provided multiple times)"
-    ),
-    echo_prompt: bool = typer.Option(
-        False, "--echo-prompt", help="Append the prompt to the mock response"
-    ),
+    mock_response: list[str] = typer.Option([], "--mock-response", help=_H_MOCK_RESPONSE),
+    echo_prompt: bool = typer.Option(False, "--echo-prompt", help=_H_ECHO_PROMPT),
     simulate_injection: bool = typer.Option(
-        False, "--simulate-injection", help="Simulate a successful injection attempt"
-    ),
-    behaviors: str = typer.Option(
-        "all", "--behaviors", "-b", help="Comma-separated behaviors to test"
+        False, "--simulate-injection", help=_H_SIMULATE_INJECTION
     ),
-    techniques: str = typer.Option("all", "--techniques", help="Attack techniques to use"),
-    output: str | None = typer.Option(None, "--output", "-o", help="Output file for results"),
+    behaviors: str = typer.Option("all", "--behaviors", "-b", help=_H_BEHAVIORS),
+    techniques: str = typer.Option("all", "--techniques", help=_H_TECHNIQUES),
+    output: str | None = typer.Option(None, "--output", "-o", help=_H_OUTPUT),
+    concurrency: int = typer.Option(1, "--concurrency", help=_H_CONCURRENCY),
 ):
     """Attack a mock agent (offline testing)."""
-    console.print(
-        Panel.fit(
-            "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]Mock Agent[/bold cyan]",
-            border_style="red",
-        )
+    _banner(
+        "[bold red]🦞 SuperClaw[/bold red] attacking [bold cyan]Mock Agent[/bold cyan]",
+        "red",
+        f"  Behaviors: [yellow]{behaviors}[/yellow]",
+        f"  Techniques: [yellow]{techniques}[/yellow]",
     )
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
-    console.print(f"  Techniques: [yellow]{techniques}[/yellow]")
-    console.print()
 
     try:
-        from superclaw.attacks import run_attack
+        run_attack = _lazy("superclaw.attacks", "run_attack")
 
-        behavior_list = behaviors.split(",") if behaviors != "all" else None
-        technique_list = techniques.split(",") if techniques != "all" else None
+        behavior_list = _parse_csv(behaviors)
+        technique_list = _parse_csv(techniques)
         adapter_config = {
             "responses": mock_response or ["Mock response"],
             "echo_prompt": echo_prompt,
@@ -192,14 +309,10 @@ def attack_mock(
             behaviors=behavior_list,
             techniques=technique_list,
             adapter_config=adapter_config,
+            concurrency=concurrency,
         )
 
-        _display_attack_results(results)
-
-        if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            console.print(f"\n[green]✓ Results saved to {output}[/green]")
+        _finalize(results, output, _display_attack_results)
     except Exception as e:
         handle_error("Mock attack failed", e)
 
@@ -227,21 +340,34 @@ def generate_scenarios(
     model: str = typer.Option(
         "claude-sonnet-4", "--model", "-m", help="Model for scenario generation"
     ),
+    batch: bool = typer.Option(
+        False,
+        "--batch/--no-batch",
+        help="Use the provider batch API for large generations (cheaper, slower)",
+    ),
+    poll_interval: float = typer.Option(
+        30.0, "--poll-interval", help="Seconds between batch status polls"
+    ),
+    prompt_cache: bool = typer.Option(
+        True,
+        "--prompt-cache/--no-prompt-cache",
+        help="Mark the static system prompt as provider-cacheable",
+    ),
 ):
     """Generate attack scenarios using Bloom ideation."""
-    console.print(
-        Panel.fit("[bold cyan]🌸 Bloom Scenario Generation[/bold cyan]", border_style="cyan")
+    _banner(
+        "[bold cyan]🌸 Bloom Scenario Generation[/bold cyan]",
+        "cyan",
+        f"  Behavior: [yellow]{behavior}[/yellow]",
+        f"  Scenarios: [cyan]{num_scenarios}[/cyan]",
+        f"  Variations: [yellow]{variations}[/yellow]",
+        f"  Model: [dim]{model}[/dim]",
     )
-    console.print(f"  Behavior: [yellow]{behavior}[/yellow]")
-    console.print(f"  Scenarios: [cyan]{num_scenarios}[/cyan]")
-    console.print(f"  Variations: [yellow]{variations}[/yellow]")
-    console.print(f"  Model: [dim]{model}[/dim]")
-    console.print()
 
     try:
-        from superclaw.bloom import generate_scenarios as gen_scenarios
+        gen_scenarios = _lazy("superclaw.bloom", "generate_scenarios")
 
-        variation_list = variations.split(",") if variations else []
+        variation_list = _parse_csv(variations) or () if variations else ()
 
         with console.status("[cyan]Generating scenarios...[/cyan]"):
             scenarios = gen_scenarios(
@@ -249,12 +375,14 @@ def generate_scenarios(
                 num_scenarios=num_scenarios,
                 variation_dimensions=variation_list,
                 model=model,
+                batch=batch,
+                poll_interval=poll_interval,
+                prompt_cache=prompt_cache,
             )
 
         console.print(f"[green]✓ Generated {len(scenarios)} scenarios[/green]")
 
-        with open(output, "w") as f:
-            json.dump(scenarios, f, indent=2)
+        _dump_json(scenarios, output)
         console.print(f"[green]✓ Saved to {output}[/green]")
     except Exception as e:
         handle_error("Scenario generation failed", e)
@@ -267,37 +395,35 @@ def generate_scenarios(
 
 @evaluate_app.command("openclaw")
 def evaluate_openclaw(
-    target: str = typer.Option(
-        "ws://127.0.0.1:18789", "--target", "-t", help="OpenClaw gateway URL"
-    ),
-    scenarios: str | None = typer.Option(None, "--scenarios", "-s", help="Scenarios JSON file"),
+    target: str = typer.Option(_DEFAULT_TARGET, "--target", "-t", help=_H_TARGET),
+    scenarios: str | None = typer.Option(None, "--scenarios", "-s", help=_H_SCENARIOS),
     behaviors: str = typer.Option("all", "--behaviors", "-b", help="Behaviors to evaluate"),
-    techniques: str = typer.Option("all", "--techniques", help="Attack techniques to use"),
+    techniques: str = typer.Option("all", "--techniques", help=_H_TECHNIQUES),
     output: str | None = typer.Option(None, "--output", "-o", help="Output file"),
+    concurrency: int = typer.Option(1, "--concurrency", help=_H_CONCURRENCY),
 ):
     """Evaluate OpenClaw agent against security behaviors."""
-    console.print(
-        Panel.fit("[bold yellow]🔍 SuperClaw Evaluation[/bold yellow]", border_style="yellow")
-    )
-    console.print(f"  Target: [cyan]{target}[/cyan]")
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
-    console.print(f"  Techniques: [yellow]{techniques}[/yellow]")
+    fields = [
+        f"  Target: [cyan]{target}[/cyan]",
+        f"  Behaviors: [yellow]{behaviors}[/yellow]",
+        f"  Techniques: [yellow]{techniques}[/yellow]",
+    ]
     if scenarios:
-        console.print(f"  Scenarios: [dim]{scenarios}[/dim]")
-    console.print()
+        fields.append(f"  Scenarios: [dim]{scenarios}[/dim]")
+    _banner("[bold yellow]🔍 SuperClaw Evaluation[/bold yellow]", "yellow", *fields)
 
     try:
-        from superclaw.attacks import run_evaluation
+        run_evaluation = _lazy("superclaw.attacks", "run_evaluation")
 
         scenario_data = None
         if scenarios:
-            if not Path(scenarios).exists():
+            scenarios_path = Path(scenarios)
+            if not scenarios_path.exists():
                 handle_error(f"Scenarios file not found: {scenarios}")
-            with open(scenarios) as f:
-                scenario_data = json.load(f)
+            scenario_data = _load_scenarios_file(scenarios_path)
 
-        behavior_list = behaviors.split(",") if behaviors != "all" else None
-        technique_list = techniques.split(",") if techniques != "all" else None
+        behavior_list = _parse_csv(behaviors)
+        technique_list = _parse_csv(techniques)
 
         results = run_evaluation(
             agent_type="openclaw",
@@ -305,14 +431,10 @@ def evaluate_openclaw(
             scenarios=scenario_data,
             behaviors=behavior_list,
             techniques=technique_list,
+            concurrency=concurrency,
         )
 
-        _display_evaluation_results(results)
-
-        if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            console.print(f"\n[green]✓ Results saved to {output}[/green]")
+        _finalize(results, output, _display_evaluation_results)
     except json.JSONDecodeError as e:
         handle_error(f"Invalid JSON in scenarios file: {scenarios}", e)
     except Exception as e:
@@ -321,39 +443,33 @@ def evaluate_openclaw(
 
 @evaluate_app.command("mock")
 def evaluate_mock(
-    mock_response: list[str] = typer.Option(
-        [], "--mock-response", help="Mock response text (can be provided multiple times)"
-    ),
-    echo_prompt: bool = typer.Option(
-        False, "--echo-prompt", help="Append the prompt to the mock response"
-    ),
+    mock_response: list[str] = typer.Option([], "--mock-response", help=_H_MOCK_RESPONSE),
+    echo_prompt: bool = typer.Option(False, "--echo-prompt", help=_H_ECHO_PROMPT),
     simulate_injection: bool = typer.Option(
-        False, "--simulate-injection", help="Simulate a successful injection attempt"
+        False, "--simulate-injection", help=_H_SIMULATE_INJECTION
     ),
-    scenarios: str | None = typer.Option(None, "--scenarios", "-s", help="Scenarios JSON file"),
+    scenarios: str | None = typer.Option(None, "--scenarios", "-s", help=_H_SCENARIOS),
     behaviors: str = typer.Option("all", "--behaviors", "-b", help="Behaviors to evaluate"),
     output: str | None = typer.Option(None, "--output", "-o", help="Output file"),
+    concurrency: int = typer.Option(1, "--concurrency", help=_H_CONCURRENCY),
 ):
     """Evaluate a mock agent (offline testing)."""
-    console.print(
-        Panel.fit("[bold yellow]🔍 SuperClaw Evaluation[/bold yellow]", border_style="yellow")
-    )
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
+    fields = [f"  Behaviors: [yellow]{behaviors}[/yellow]"]
     if scenarios:
-        console.print(f"  Scenarios: [dim]{scenarios}[/dim]")
-    console.print()
+        fields.append(f"  Scenarios: [dim]{scenarios}[/dim]")
+    _banner("[bold yellow]🔍 SuperClaw Evaluation[/bold yellow]", "yellow", *fields)
 
     try:
-        from superclaw.attacks import run_evaluation
+        run_evaluation = _lazy("superclaw.attacks", "run_evaluation")
 
         scenario_data = None
         if scenarios:
-            if not Path(scenarios).exists():
+            scenarios_path = Path(scenarios)
+            if not scenarios_path.exists():
                 handle_error(f"Scenarios file not found: {scenarios}")
-            with open(scenarios) as f:
-                scenario_data = json.load(f)
+            scenario_data = _load_scenarios_file(scenarios_path)
 
-        behavior_list = behaviors.split(",") if behaviors != "all" else None
+        behavior_list = _parse_csv(behaviors)
         adapter_config = {
             "responses": mock_response or ["Mock response"],
             "echo_prompt": echo_prompt,
@@ -366,14 +482,10 @@ def evaluate_mock(
             scenarios=scenario_data,
             behaviors=behavior_list,
             adapter_config=adapter_config,
+            concurrency=concurrency,
         )
 
-        _display_evaluation_results(results)
-
-        if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            console.print(f"\n[green]✓ Results saved to {output}[/green]")
+        _finalize(results, output, _display_evaluation_results)
     except json.JSONDecodeError as e:
         handle_error(f"Invalid JSON in scenarios file: {scenarios}", e)
     except Exception as e:
@@ -387,9 +499,7 @@ def evaluate_mock(
 
 @audit_app.command("openclaw")
 def audit_openclaw(
-    target: str = typer.Option(
-        "ws://127.0.0.1:18789", "--target", "-t", help="OpenClaw gateway URL"
-    ),
+    target: str = typer.Option(_DEFAULT_TARGET, "--target", "-t", help=_H_TARGET),
     comprehensive: bool = typer.Option(
         False, "--comprehensive", help="Run comprehensive audit (all behaviors, all techniques)"
     ),
@@ -406,20 +516,17 @@ def audit_openclaw(
     """Run security audit on OpenClaw agent."""
     mode = "comprehensive" if comprehensive else "quick" if quick else "standard"
 
-    console.print(
-        Panel.fit(
-            f"[bold yellow]🔍 SuperClaw Security Audit[/bold yellow] ({mode})",
-            border_style="yellow",
-        )
+    _banner(
+        f"[bold yellow]🔍 SuperClaw Security Audit[/bold yellow] ({mode})",
+        "yellow",
+        f"  Target: [cyan]{target}[/cyan]",
+        f"  Mode: [yellow]{mode}[/yellow]",
+        f"  Format: [dim]{report_format}[/dim]",
     )
-    console.print(f"  Target: [cyan]{target}[/cyan]")
-    console.print(f"  Mode: [yellow]{mode}[/yellow]")
-    console.print(f"  Format: [dim]{report_format}[/dim]")
-    console.print()
 
     try:
-        from superclaw.attacks import run_audit
-        from superclaw.reporting import generate_report
+        run_audit = _lazy("superclaw.attacks", "run_audit")
+        generate_report = _lazy("superclaw.reporting", "generate_report")
 
         with console.status(f"[yellow]Running {mode} audit...[/yellow]"):
             results = run_audit(
@@ -455,19 +562,21 @@ def report_generate(
     output: str = typer.Option("report", "--output", "-o", help="Output file (without extension)"),
 ):
     """Generate a report from attack/evaluation results."""
-    console.print(Panel.fit("[bold cyan]📊 Report Generation[/bold cyan]", border_style="cyan"))
-    console.print(f"  Results: [dim]{results_file}[/dim]")
-    console.print(f"  Format: [yellow]{report_format}[/yellow]")
-    console.print()
+    _banner(
+        "[bold cyan]📊 Report Generation[/bold cyan]",
+        "cyan",
+        f"  Results: [dim]{results_file}[/dim]",
+        f"  Format: [yellow]{report_format}[/yellow]",
+    )
 
     try:
-        if not Path(results_file).exists():
+        results_path = Path(results_file)
+        if not results_path.exists():
             handle_error(f"Results file not found: {results_file}")
 
-        with open(results_file) as f:
-            results = json.load(f)
+        results = _load_json(results_path)
 
-        from superclaw.reporting import generate_report
+        generate_report = _lazy("superclaw.reporting", "generate_report")
 
         output_file = f"{output}.{report_format}"
         generate_report(results, format=report_format, output=output_file)
@@ -488,32 +597,39 @@ def report_drift(
     output: str | None = typer.Option(
         None, "--output", "-o", help="Write JSON drift report to file"
     ),
+    plain: bool = typer.Option(False, "--plain", help=_H_PLAIN),
 ):
     """Compare two runs and report drift."""
-    console.print(
-        Panel.fit("[bold cyan]📈 SuperClaw Drift Report[/bold cyan]", border_style="cyan")
+    _banner(
+        "[bold cyan]📈 SuperClaw Drift Report[/bold cyan]",
+        "cyan",
+        f"  Baseline: [dim]{baseline}[/dim]",
+        f"  Current: [dim]{current}[/dim]",
     )
-    console.print(f"  Baseline: [dim]{baseline}[/dim]")
-    console.print(f"  Current: [dim]{current}[/dim]")
-    console.print()
 
     try:
-        if not Path(baseline).exists():
+        baseline_path = Path(baseline)
+        current_path = Path(current)
+        if not baseline_path.exists():
             handle_error(f"Baseline file not found: {baseline}")
-        if not Path(current).exists():
+        if not current_path.exists():
             handle_error(f"Current file not found: {current}")
 
-        with open(baseline) as f:
-            baseline_data = json.load(f)
-        with open(current) as f:
-            current_data = json.load(f)
+        # The two dumps are independent; orjson releases the GIL while
+        # parsing, so reading and decoding them on two threads overlaps.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            baseline_future = executor.submit(_load_json, baseline_path)
+            current_future = executor.submit(_load_json, current_path)
+            baseline_data = baseline_future.result()
+            current_data = current_future.result()
 
-        from superclaw.analysis import DriftConfig, compare_runs
+        drift_config_cls = _lazy("superclaw.analysis", "DriftConfig")
+        compare_runs = _lazy("superclaw.analysis", "compare_runs")
 
         drift = compare_runs(
             baseline_data,
             current_data,
-            config=DriftConfig(score_drop_threshold=score_drop_threshold),
+            config=drift_config_cls(score_drop_threshold=score_drop_threshold),
         )
 
         summary = drift.get("summary", {})
@@ -522,27 +638,35 @@ def report_drift(
             f"Improvements: {summary.get('improvements', 0)}"
         )
 
-        table = Table(title="Behavior Drift", border_style="cyan")
-        table.add_column("Behavior", style="cyan")
-        table.add_column("Baseline", style="white")
-        table.add_column("Current", style="white")
-        table.add_column("Δ", style="yellow")
-        table.add_column("Change", style="red")
-
-        for diff in drift.get("behavior_diffs", []):
-            table.add_row(
+        rows = [
+            (
                 str(diff.get("behavior", "")),
                 f"{diff.get('baseline_score', 0.0):.2f}",
                 f"{diff.get('current_score', 0.0):.2f}",
                 f"{diff.get('delta', 0.0):.2f}",
                 str(diff.get("status_change", "")),
             )
-
-        console.print(table)
+            for diff in drift.get("behavior_diffs", [])
+        ]
+
+        if not rows:
+            # Clean runs skip Table construction and column-width work.
+            console.print("[dim]No behavior changes[/dim]")
+        elif plain:
+            print("\n".join("\t".join(row) for row in rows))
+        else:
+            table = Table(title="Behavior Drift", border_style="cyan")
+            table.add_column("Behavior", style="cyan")
+            table.add_column("Baseline", style="white")
+            table.add_column("Current", style="white")
+            table.add_column("Δ", style="yellow")
+            table.add_column("Change", style="red")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
 
         if output:
-            with open(output, "w") as f:
-                json.dump(drift, f, indent=2, default=str)
+            _dump_json(drift, output)
             console.print(f"\n[green]✓ Drift report saved to {output}[/green]")
     except json.JSONDecodeError as e:
         handle_error("Invalid JSON in results file", e)
@@ -563,40 +687,54 @@ def report_drift(
 @scan_app.command("config")
 def scan_config(
     config: str = typer.Option(
-        str(Path.home() / ".superclaw" / "config.yaml"),
+        _DEFAULT_CONFIG,
         "--config",
         "-c",
         help="Path to superclaw config file",
     ),
-    output: str | None = typer.Option(None, "--output", "-o", help="Write JSON results to file"),
+    output: str | None = typer.Option(None, "--output", "-o", help=_H_OUTPUT_JSON),
+    plain: bool = typer.Option(False, "--plain", help=_H_PLAIN),
 ):
     """Scan SuperClaw config for risky settings."""
-    console.print(Panel.fit("[bold cyan]🔍 SuperClaw Config Scan[/bold cyan]", border_style="cyan"))
-    console.print(f"  Config: [dim]{config}[/dim]")
-    console.print()
+    _banner(
+        "[bold cyan]🔍 SuperClaw Config Scan[/bold cyan]",
+        "cyan",
+        f"  Config: [dim]{config}[/dim]",
+    )
 
     try:
-        from superclaw.scanners import scan_config as run_scan
+        run_scan = _lazy("superclaw.scanners", "scan_config")
 
         results = run_scan(Path(config))
 
         summary = results.get("summary", {})
-        table = Table(title="Scan Findings", border_style="cyan")
-        table.add_column("Rule", style="cyan")
-        table.add_column("Severity", style="yellow")
-        table.add_column("Message", style="white")
-        table.add_column("Remediation", style="green")
-
         findings = results.get("findings", [])
-        for finding in findings:
-            table.add_row(
+        # Rows built up front; add_row in a tight loop keeps Rich's per-cell
+        # style resolution off the formatting path.
+        rows = [
+            (
                 str(finding.get("rule", "")),
                 str(finding.get("severity", "")),
                 str(finding.get("message", "")),
                 str(finding.get("remediation", "")),
             )
-
-        console.print(table)
+            for finding in findings
+        ]
+
+        if not rows:
+            # Clean runs skip Table construction and column-width work.
+            console.print("[green]No findings[/green]")
+        elif plain:
+            print("\n".join("\t".join(row) for row in rows))
+        else:
+            table = Table(title="Scan Findings", border_style="cyan")
+            table.add_column("Rule", style="cyan")
+            table.add_column("Severity", style="yellow")
+            table.add_column("Message", style="white")
+            table.add_column("Remediation", style="green")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
         console.print(
             f"\n[bold]Total:[/bold] {summary.get('total', 0)} | "
             f"Critical: {summary.get('severity', {}).get('critical', 0)} | "
@@ -606,8 +744,7 @@ def scan_config(
         )
 
         if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
+            _dump_json(results, output)
             console.print(f"\n[green]✓ Results saved to {output}[/green]")
     except Exception as e:
         handle_error("Config scan failed", e)
@@ -616,39 +753,49 @@ def scan_config(
 @scan_app.command("skills")
 def scan_skills(
     path: str = typer.Option(".", "--path", "-p", help="Path to skills/plugins directory"),
-    output: str | None = typer.Option(None, "--output", "-o", help="Write JSON results to file"),
+    output: str | None = typer.Option(None, "--output", "-o", help=_H_OUTPUT_JSON),
+    plain: bool = typer.Option(False, "--plain", help=_H_PLAIN),
 ):
     """Scan skills/plugins for supply-chain risks."""
-    console.print(
-        Panel.fit("[bold cyan]🧪 SuperClaw Supply-Chain Scan[/bold cyan]", border_style="cyan")
+    _banner(
+        "[bold cyan]🧪 SuperClaw Supply-Chain Scan[/bold cyan]",
+        "cyan",
+        f"  Path: [dim]{path}[/dim]",
     )
-    console.print(f"  Path: [dim]{path}[/dim]")
-    console.print()
 
     try:
-        from superclaw.scanners import scan_skills as run_scan
+        run_scan = _lazy("superclaw.scanners", "scan_skills")
 
         results = run_scan(Path(path))
 
         summary = results.get("summary", {})
-        table = Table(title="Supply-Chain Findings", border_style="cyan")
-        table.add_column("Rule", style="cyan")
-        table.add_column("Severity", style="yellow")
-        table.add_column("File", style="white")
-        table.add_column("Line", style="white")
-        table.add_column("Message", style="green")
-
         findings = results.get("findings", [])
-        for finding in findings:
-            table.add_row(
+        rows = [
+            (
                 str(finding.get("rule", "")),
                 str(finding.get("severity", "")),
                 str(finding.get("file", "")),
                 str(finding.get("line", "")),
                 str(finding.get("message", "")),
             )
-
-        console.print(table)
+            for finding in findings
+        ]
+
+        if not rows:
+            # Clean runs skip Table construction and column-width work.
+            console.print("[green]No findings[/green]")
+        elif plain:
+            print("\n".join("\t".join(row) for row in rows))
+        else:
+            table = Table(title="Supply-Chain Findings", border_style="cyan")
+            table.add_column("Rule", style="cyan")
+            table.add_column("Severity", style="yellow")
+            table.add_column("File", style="white")
+            table.add_column("Line", style="white")
+            table.add_column("Message", style="green")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
         console.print(
             f"\n[bold]Total:[/bold] {summary.get('total', 0)} | "
             f"Critical: {summary.get('severity', {}).get('critical', 0)} | "
@@ -658,31 +805,50 @@ def scan_skills(
         )
 
         if output:
-            with open(output, "w") as f:
-                json.dump(results, f, indent=2, default=str)
+            _dump_json(results, output)
             console.print(f"\n[green]✓ Results saved to {output}[/green]")
     except Exception as e:
         handle_error("Supply-chain scan failed", e)
 
 
+@functools.cache
+def _behavior_rows() -> list[tuple[str, str, str]]:
+    """Instantiate each registered behavior once per process for listing."""
+    behavior_registry = _lazy("superclaw.behaviors", "BEHAVIOR_REGISTRY")
+    rows = []
+    for name, behavior_class in behavior_registry.items():
+        behavior = behavior_class()
+        desc = behavior.get_description()
+        desc_display = desc[:60] + "..." if len(desc) > 60 else desc
+        severity = getattr(behavior, "default_severity", None)
+        rows.append((name, desc_display, severity.value if severity else "medium"))
+    return rows
+
+
+@functools.cache
+def _attack_rows() -> list[tuple[str, str, str]]:
+    """Instantiate each registered attack once per process for listing."""
+    attack_registry = _lazy("superclaw.attacks", "ATTACK_REGISTRY")
+    rows = []
+    for name, attack_class in attack_registry.items():
+        attack = attack_class()
+        desc = attack.description
+        desc_display = desc[:60] + "..." if len(desc) > 60 else desc
+        rows.append((name, desc_display, attack.attack_type))
+    return rows
+
+
 @app.command("behaviors")
 def list_behaviors():
     """List available security behaviors."""
     try:
-        from superclaw.behaviors import BEHAVIOR_REGISTRY
-
         table = Table(title="Available Behaviors", border_style="cyan")
         table.add_column("Name", style="cyan")
         table.add_column("Description", style="white")
         table.add_column("Severity", style="yellow")
 
-        for name, behavior_class in BEHAVIOR_REGISTRY.items():
-            behavior = behavior_class()
-            desc = behavior.get_description()
-            desc_display = desc[:60] + "..." if len(desc) > 60 else desc
-            severity = getattr(behavior, "default_severity", None)
-            severity_str = severity.value if severity else "medium"
-            table.add_row(name, desc_display, severity_str)
+        for row in _behavior_rows():
+            table.add_row(*row)
 
         console.print(table)
     except Exception as e:
@@ -693,18 +859,13 @@ def list_behaviors():
 def list_attacks():
     """List available attack techniques."""
     try:
-        from superclaw.attacks import ATTACK_REGISTRY
-
         table = Table(title="Available Attack Techniques", border_style="red")
         table.add_column("Name", style="red")
         table.add_column("Description", style="white")
         table.add_column("Type", style="yellow")
 
-        for name, attack_class in ATTACK_REGISTRY.items():
-            attack = attack_class()
-            desc = attack.description
-            desc_display = desc[:60] + "..." if len(desc) > 60 else desc
-            table.add_row(name, desc_display, attack.attack_type)
+        for row in _attack_rows():
+            table.add_row(*row)
 
         console.print(table)
     except Exception as e:
@@ -716,8 +877,8 @@ def init_config(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing config"),
 ):
     """Initialize SuperClaw configuration."""
-    config_dir = Path.home() / ".superclaw"
-    config_file = config_dir / "config.yaml"
+    config_dir = _CONFIG_DIR
+    config_file = _CONFIG_FILE
 
     if config_file.exists() and not force:
         console.print(f"[yellow]Config already exists at {config_file}[/yellow]")
@@ -804,7 +965,7 @@ def codeoptix_register():
 
 @codeoptix_app.command("evaluate")
 def codeoptix_evaluate(
-    target: str = typer.Option("ws://127.0.0.1:18789", "--target", "-t", help="Agent target URL"),
+    target: str = typer.Option(_DEFAULT_TARGET, "--target", "-t", help="Agent target URL"),
     behaviors: str = typer.Option(
         "all", "--behaviors", "-b", help="Comma-separated behaviors to evaluate"
     ),
@@ -814,17 +975,16 @@ def codeoptix_evaluate(
         "-l",
         help="LLM provider for multi-modal evaluation (openai, anthropic, etc.)",
     ),
-    output: str | None = typer.Option(None, "--output", "-o", help="Output file for results"),
+    output: str | None = typer.Option(None, "--output", "-o", help=_H_OUTPUT),
 ):
     """Run CodeOptiX-style multi-modal security evaluation."""
-    console.print(
-        Panel.fit("[bold cyan]🔬 CodeOptiX Security Evaluation[/bold cyan]", border_style="cyan")
-    )
-    console.print(f"  Target: [cyan]{target}[/cyan]")
-    console.print(f"  Behaviors: [yellow]{behaviors}[/yellow]")
+    fields = [
+        f"  Target: [cyan]{target}[/cyan]",
+        f"  Behaviors: [yellow]{behaviors}[/yellow]",
+    ]
     if llm_provider:
-        console.print(f"  LLM Provider: [dim]{llm_provider}[/dim]")
-    console.print()
+        fields.append(f"  LLM Provider: [dim]{llm_provider}[/dim]")
+    _banner("[bold cyan]🔬 CodeOptiX Security Evaluation[/bold cyan]", "cyan", *fields)
 
     try:
         from superclaw.adapters import create_adapter
@@ -850,8 +1010,7 @@ def codeoptix_evaluate(
         _display_codeoptix_results(result)
 
         if output:
-            with open(output, "w") as f:
-                json.dump(result.to_dict(), f, indent=2, default=str)
+            _dump_json(result.to_dict(), output)
             console.print(f"\n[green]✓ Results saved to {output}[/green]")
 
         # Exit with non-zero if failed
@@ -1016,9 +1175,83 @@ def _display_audit_summary(results: dict):
     console.print(f"  Low Findings: [dim]{summary.get('low', 0)}[/dim]")
 
 
+# Static dispatch table for short-lived commands whose wall clock is
+# dominated by Click building its parser tree. Each entry maps the
+# subcommand path to (handler, flag spec); every parameter appears in the
+# spec so handlers are always called with real values, never typer.Option
+# defaults. Anything not matched here (including --help) falls back to
+# Typer unchanged.
+_FAST_COMMANDS: dict[tuple[str, ...], tuple[Any, tuple[tuple[str, tuple[str, ...], Any], ...]]] = {
+    ("version",): (version, ()),
+    ("behaviors",): (list_behaviors, ()),
+    ("attacks",): (list_attacks, ()),
+    ("scan", "config"): (
+        scan_config,
+        (
+            ("config", ("--config", "-c"), _DEFAULT_CONFIG),
+            ("output", ("--output", "-o"), None),
+            ("plain", ("--plain",), False),
+        ),
+    ),
+    ("scan", "skills"): (
+        scan_skills,
+        (
+            ("path", ("--path", "-p"), "."),
+            ("output", ("--output", "-o"), None),
+            ("plain", ("--plain",), False),
+        ),
+    ),
+}
+
+
+def _fast_dispatch(argv: list[str]) -> bool:
+    """Run argv through the static command table, bypassing Click.
+
+    Returns True if the command was handled. Unknown commands, unknown
+    flags, and help requests return False so Typer produces its usual
+    parsing, validation, and help output.
+    """
+    entry = None
+    for depth in (2, 1):
+        entry = _FAST_COMMANDS.get(tuple(argv[:depth]))
+        if entry is not None:
+            break
+    if entry is None:
+        return False
+
+    handler, spec = entry
+    kwargs = {dest: default for dest, _, default in spec}
+    rest = argv[depth:]
+    i = 0
+    while i < len(rest):
+        arg, _, inline = rest[i].partition("=")
+        for dest, flags, default in spec:
+            if arg in flags:
+                if isinstance(default, bool):
+                    kwargs[dest] = True
+                elif inline:
+                    kwargs[dest] = inline
+                elif i + 1 < len(rest):
+                    i += 1
+                    kwargs[dest] = rest[i]
+                else:
+                    return False
+                break
+        else:
+            return False
+        i += 1
+
+    try:
+        handler(**kwargs)
+    except typer.Exit as e:
+        raise SystemExit(e.exit_code) from None
+    return True
+
+
 def main():
     """Entry point for SuperClaw CLI."""
-    app()
+    if not _fast_dispatch(sys.argv[1:]):
+        app()
 
 
 if __name__ == "__main__":
@@ -4,19 +4,7 @@ This module provides hooks to use SuperClaw security behaviors
 with CodeOptiX's evaluation engine and multi-modal evaluation.
 """
 
-from superclaw.codeoptix.adapter import (
-    SuperClawBehaviorAdapter,
-    adapt_behavior_to_codeoptix,
-    register_superclaw_behaviors,
-)
-from superclaw.codeoptix.engine import (
-    SecurityEvaluationEngine,
-    create_security_engine,
-)
-from superclaw.codeoptix.evaluator import (
-    SecurityEvaluator,
-    create_security_evaluator,
-)
+from typing import Any
 
 __all__ = [
     "SuperClawBehaviorAdapter",
@@ -27,3 +15,27 @@ __all__ = [
     "SecurityEvaluationEngine",
     "create_security_engine",
 ]
+
+# PEP 562 lazy loading: touching superclaw.codeoptix no longer imports the
+# adapter, engine and evaluator eagerly; each submodule loads on first
+# attribute use, so CLI commands only pay for the piece they call.
+_SUBMODULES = {
+    "SuperClawBehaviorAdapter": "adapter",
+    "adapt_behavior_to_codeoptix": "adapter",
+    "register_superclaw_behaviors": "adapter",
+    "SecurityEvaluator": "evaluator",
+    "create_security_evaluator": "evaluator",
+    "SecurityEvaluationEngine": "engine",
+    "create_security_engine": "engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f"superclaw.codeoptix.{_SUBMODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,7 @@ evaluation engine and benefit from its multi-modal evaluation pipeline.
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -14,6 +15,11 @@ if TYPE_CHECKING:
 from superclaw.adapters.base import AgentOutput
 from superclaw.behaviors import BEHAVIOR_REGISTRY, BehaviorResult, BehaviorSpec, Severity
 
+# Whether outputs of a given type need CodeOptiX-to-SuperClaw conversion,
+# decided once per type instead of re-probing attributes on every evaluate
+# call. Adapters see a handful of output types at most.
+_CONV_CACHE: dict[type, bool] = {}
+
 
 def _codeoptix_available() -> bool:
     """Check if CodeOptiX is installed."""
@@ -80,8 +86,17 @@ class SuperClawBehaviorAdapter:
         Returns:
             BehaviorResult from evaluation
         """
-        # Convert CodeOptiX AgentOutput to SuperClaw AgentOutput if needed
-        if hasattr(agent_output, "code") and not hasattr(agent_output, "tool_calls"):
+        # Convert CodeOptiX AgentOutput to SuperClaw AgentOutput if needed;
+        # the decision is structural, so it is cached per output type.
+        output_type = type(agent_output)
+        needs_conversion = _CONV_CACHE.get(output_type)
+        if needs_conversion is None:
+            needs_conversion = hasattr(agent_output, "code") and not hasattr(
+                agent_output, "tool_calls"
+            )
+            _CONV_CACHE[output_type] = needs_conversion
+
+        if needs_conversion:
             # This is a CodeOptiX AgentOutput, convert it
             superclaw_output = self._convert_to_superclaw_output(agent_output)
         else:
@@ -99,13 +114,25 @@ class SuperClawBehaviorAdapter:
         Returns:
             SuperClaw AgentOutput
         """
+        # One instance-dict read instead of a getattr (instance, class, MRO
+        # walk) per field; slotted outputs fall back to getattr.
+        attrs = getattr(codeoptix_output, "__dict__", None)
+        if attrs is not None:
+            code = attrs.get("code") or ""
+            tests = attrs.get("tests") or ""
+            metadata = attrs.get("metadata") or {}
+        else:
+            code = getattr(codeoptix_output, "code", "") or ""
+            tests = getattr(codeoptix_output, "tests", "") or ""
+            metadata = getattr(codeoptix_output, "metadata", {}) or {}
+
         return AgentOutput(
-            code=getattr(codeoptix_output, "code", "") or "",
-            tests=getattr(codeoptix_output, "tests", "") or "",
-            response_text=getattr(codeoptix_output, "code", "") or "",
+            code=code,
+            tests=tests,
+            response_text=code,
             tool_calls=[],
             tool_results=[],
-            session_metadata=getattr(codeoptix_output, "metadata", {}) or {},
+            session_metadata=metadata,
             acp_messages=[],
             sandbox_access_log=[],
             injection_attempts_detected=[],
@@ -132,6 +159,11 @@ def adapt_behavior_to_codeoptix(behavior_name: str, config: dict[str, Any] | Non
     return SuperClawBehaviorAdapter(superclaw_behavior)
 
 
+def _adapter_factory(behavior_cls: type, config: dict[str, Any] | None = None):
+    """Build an adapted behavior; partial-bound per class at registration."""
+    return SuperClawBehaviorAdapter(behavior_cls(config))
+
+
 def register_superclaw_behaviors() -> dict[str, type]:
     """
     Register all SuperClaw security behaviors with CodeOptiX.
@@ -157,15 +189,9 @@ def register_superclaw_behaviors() -> dict[str, type]:
         # Prefix with 'security-' to avoid conflicts
         codeoptix_name = f"security-{name}" if not name.startswith("security-") else name
 
-        # Create a factory that returns adapted behavior
-        def make_factory(behavior_cls):
-            def factory(config=None):
-                superclaw_behavior = behavior_cls(config)
-                return SuperClawBehaviorAdapter(superclaw_behavior)
-
-            return factory
-
-        CODEOPTIX_REGISTRY[codeoptix_name] = make_factory(behavior_class)
+        # One picklable partial per behavior instead of a fresh closure
+        # (function object plus cell) built in the loop.
+        CODEOPTIX_REGISTRY[codeoptix_name] = functools.partial(_adapter_factory, behavior_class)
         registered[codeoptix_name] = behavior_class
 
     return registered
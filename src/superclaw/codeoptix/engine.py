@@ -9,8 +9,13 @@ This provides a complete security testing workflow with:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import time
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from statistics import fmean
 from typing import Any
 
 from superclaw.adapters.base import AgentAdapter, AgentOutput
@@ -35,20 +40,28 @@ class SecurityEngineResult:
     summary: dict[str, Any] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # to_dict is typically called more than once per result (console
+        # display plus --output); cache the built dict since the fields are
+        # never mutated after construction.
+        self._dict_cache: dict[str, Any] | None = None
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "agent_type": self.agent_type,
-            "target": self.target,
-            "timestamp": self.timestamp,
-            "overall_score": self.overall_score,
-            "overall_passed": self.overall_passed,
-            "behaviors": {name: result.to_dict() for name, result in self.behaviors.items()},
-            "scenarios_tested": self.scenarios_tested,
-            "scenarios_passed": self.scenarios_passed,
-            "summary": self.summary,
-            "metadata": self.metadata,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "agent_type": self.agent_type,
+                "target": self.target,
+                "timestamp": self.timestamp,
+                "overall_score": self.overall_score,
+                "overall_passed": self.overall_passed,
+                "behaviors": {name: result.to_dict() for name, result in self.behaviors.items()},
+                "scenarios_tested": self.scenarios_tested,
+                "scenarios_passed": self.scenarios_passed,
+                "summary": self.summary,
+                "metadata": self.metadata,
+            }
+        return self._dict_cache
 
 
 class SecurityEvaluationEngine:
@@ -87,7 +100,150 @@ class SecurityEvaluationEngine:
         )
 
         # Initialize scenario generator
-        self._scenario_generator = None
+        self._ideation_engine = None
+
+        # Behavior instances, built once per engine. create_behavior runs
+        # each class's full __init__; the engine only needs one instance
+        # per name for descriptions, severities and evaluation.
+        self._behavior_cache: dict[str, Any] = {}
+
+        # Agent responses keyed by (behavior, prompt digest). Basic and
+        # Bloom-cached scenarios repeat verbatim across runs, so repeat
+        # evaluations can skip the network round-trip entirely. Disk-backed
+        # caching is available by wrapping the adapter in
+        # superclaw.bloom.CachingAdapter instead.
+        self._prompt_cache: dict[tuple[str, str], tuple[float, AgentOutput]] = {}
+
+        # Semantic cache layered on the exact one: Bloom rewordings of the
+        # same scenario miss the digest key but embed close together.
+        # Enabled by the ``semantic_cache`` config key; the embedder loads
+        # lazily since it is an optional dependency with a fixed CPU cost.
+        self._semantic_model: Any | None = None
+        self._semantic_cache: dict[str, tuple[list[Any], list[AgentOutput]]] = {}
+
+        # In-flight sends keyed by prompt digest: when the gather fan-out
+        # contains duplicate prompts (common with default scenarios), the
+        # followers await the leader's future instead of hitting the agent.
+        self._inflight: dict[str, asyncio.Future[AgentOutput]] = {}
+
+        # Set while the engine is entered as an async context manager; the
+        # connection then persists across aevaluate_security calls instead
+        # of being re-established per run.
+        self._connected: bool | None = None
+
+    async def __aenter__(self) -> SecurityEvaluationEngine:
+        """Connect the adapter once for the lifetime of the context."""
+        try:
+            self._connected = await self.adapter.connect()
+        except Exception:
+            self._connected = False
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._connected:
+            await self.adapter.disconnect()
+        self._connected = None
+
+    def _get_behavior(self, name: str) -> Any:
+        """Return the cached behavior instance for name, creating it once."""
+        behavior = self._behavior_cache.get(name)
+        if behavior is None:
+            behavior = self._behavior_cache[name] = create_behavior(name)
+        return behavior
+
+    async def _send_cached(
+        self,
+        behavior_name: str,
+        prompt: str,
+        context: dict[str, Any],
+    ) -> AgentOutput:
+        """Send a prompt through the adapter, reusing cached responses.
+
+        Enabled by the ``cache_enabled`` config key; entries expire after
+        ``cache_ttl`` seconds (default one hour).
+        """
+        if not self.config.get("cache_enabled", False):
+            return await self._send_dedup(prompt, context)
+
+        key = (behavior_name, hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest())
+        entry = self._prompt_cache.get(key)
+        if entry is not None:
+            stamp, output = entry
+            if time.time() - stamp < self.config.get("cache_ttl", 3600):
+                return output
+            del self._prompt_cache[key]
+
+        semantic = self.config.get("semantic_cache", False)
+        if semantic:
+            vector = await asyncio.to_thread(self._embed, prompt)
+            cached = self._semantic_lookup(behavior_name, vector)
+            if cached is not None:
+                return cached
+
+        output = await self._send_dedup(prompt, context)
+        self._prompt_cache[key] = (time.time(), output)
+        if semantic:
+            vectors, outputs = self._semantic_cache.setdefault(behavior_name, ([], []))
+            vectors.append(vector)
+            outputs.append(output)
+        return output
+
+    async def _send_dedup(self, prompt: str, context: dict[str, Any]) -> AgentOutput:
+        """Send a prompt, collapsing concurrent identical sends to one call."""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        future = self._inflight.get(key)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            output = await self.adapter.send_prompt(prompt, context)
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a follower-less failure does not warn;
+            # awaiting followers still see the exception.
+            future.exception()
+            raise
+        else:
+            future.set_result(output)
+            return output
+        finally:
+            self._inflight.pop(key, None)
+
+    def _embed(self, prompt: str) -> Any:
+        """Embed a prompt with the configured sentence-transformers model."""
+        if self._semantic_model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise RuntimeError(
+                    "sentence-transformers not installed. "
+                    "Install with: pip install sentence-transformers"
+                ) from e
+            self._semantic_model = SentenceTransformer(
+                self.config.get("semantic_model", "all-MiniLM-L6-v2")
+            )
+        return self._semantic_model.encode([prompt], normalize_embeddings=True)[0]
+
+    def _semantic_lookup(self, behavior_name: str, vector: Any) -> AgentOutput | None:
+        """Return the cached response closest to vector, if close enough.
+
+        Embeddings are unit-normalized, so the inner product is cosine
+        similarity; a plain matrix product over the per-behavior entries
+        is enough at cache sizes an evaluation run produces.
+        """
+        entry = self._semantic_cache.get(behavior_name)
+        if not entry or not entry[0]:
+            return None
+        vectors, outputs = entry
+        import numpy as np
+
+        similarities = np.asarray(vectors) @ vector
+        best = int(similarities.argmax())
+        if similarities[best] >= self.config.get("semantic_threshold", 0.92):
+            return outputs[best]
+        return None
 
     def evaluate_security(
         self,
@@ -106,29 +262,60 @@ class SecurityEvaluationEngine:
         Returns:
             SecurityEngineResult with full evaluation
         """
+        return asyncio.run(self.aevaluate_security(behavior_names, scenarios, context))
+
+    async def aevaluate_security(
+        self,
+        behavior_names: list[str] | None = None,
+        scenarios: list[dict[str, Any]] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> SecurityEngineResult:
+        """Async variant of :meth:`evaluate_security`.
+
+        Inside ``async with engine:`` the adapter connection established on
+        entry is reused, so back-to-back evaluations skip the per-run
+        handshake.
+        """
+        return await self._evaluate_security_async(behavior_names, scenarios, context)
+
+    async def _evaluate_security_async(
+        self,
+        behavior_names: list[str] | None = None,
+        scenarios: list[dict[str, Any]] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> SecurityEngineResult:
+        """Async implementation behind :meth:`evaluate_security`."""
+        # Stamped once up front: the result records when the evaluation
+        # started, and nothing below needs to re-read the clock.
+        timestamp = datetime.now(UTC).isoformat()
         context = context or {}
         behavior_names = behavior_names or list(BEHAVIOR_REGISTRY.keys())
 
         # Generate scenarios if not provided
         if not scenarios:
-            scenarios = self._generate_scenarios(behavior_names)
+            scenarios = await self._generate_scenarios(behavior_names)
 
         # Track results
         all_behavior_results: dict[str, SecurityEvaluationResult] = {}
         scenarios_tested = 0
         scenarios_passed = 0
 
-        # Evaluate each behavior
-        for behavior_name in behavior_names:
-            if behavior_name not in BEHAVIOR_REGISTRY:
-                continue
+        # Index scenarios by behavior in one pass instead of re-filtering
+        # the full list for every behavior.
+        by_behavior: dict[str, list[dict[str, Any]]] = {}
+        for scenario in scenarios:
+            by_behavior.setdefault(scenario.get("behavior"), []).append(scenario)
 
-            # Get scenarios for this behavior
-            behavior_scenarios = [s for s in scenarios if s.get("behavior") == behavior_name]
+        # Resolve each behavior's scenario list up front so the coroutines
+        # below receive ready inputs.
+        valid_names = [name for name in behavior_names if name in BEHAVIOR_REGISTRY]
+        scenario_lists: list[list[dict[str, Any]]] = []
+        for behavior_name in valid_names:
+            behavior_scenarios = by_behavior.get(behavior_name, [])
 
             if not behavior_scenarios:
                 # Generate a default scenario
-                behavior = create_behavior(behavior_name)
+                behavior = self._get_behavior(behavior_name)
                 behavior_scenarios = [
                     {
                         "behavior": behavior_name,
@@ -137,13 +324,49 @@ class SecurityEvaluationEngine:
                     }
                 ]
 
-            # Evaluate behavior across scenarios
-            behavior_result = self._evaluate_behavior(
-                behavior_name=behavior_name,
-                scenarios=behavior_scenarios,
-                context=context,
+            scenario_lists.append(behavior_scenarios)
+
+        # Each behavior's network calls are independent, so evaluate them
+        # concurrently over one adapter connection; the behavior-level
+        # fan-out is bounded separately from the per-scenario one.
+        behavior_semaphore = asyncio.Semaphore(self.config.get("max_concurrent_behaviors", 5))
+
+        async def run_behavior(
+            name: str, behavior_scenarios: list[dict[str, Any]]
+        ) -> SecurityEvaluationResult:
+            async with behavior_semaphore:
+                return await self._evaluate_behavior_async(
+                    behavior_name=name,
+                    scenarios=behavior_scenarios,
+                    context=context,
+                    connected=connected,
+                )
+
+        # Reuse the context-manager connection when present; otherwise
+        # connect for this run only.
+        own_connection = self._connected is None
+        if own_connection:
+            try:
+                connected = await self.adapter.connect()
+            except Exception:
+                connected = False
+        else:
+            connected = self._connected
+
+        try:
+            behavior_results = await asyncio.gather(
+                *(
+                    run_behavior(name, behavior_scenarios)
+                    for name, behavior_scenarios in zip(valid_names, scenario_lists)
+                )
             )
+        finally:
+            if own_connection and connected:
+                await self.adapter.disconnect()
 
+        for behavior_name, behavior_scenarios, behavior_result in zip(
+            valid_names, scenario_lists, behavior_results
+        ):
             all_behavior_results[behavior_name] = behavior_result
             scenarios_tested += len(behavior_scenarios)
             if behavior_result.passed:
@@ -151,8 +374,7 @@ class SecurityEvaluationEngine:
 
         # Calculate overall results
         if all_behavior_results:
-            scores = [r.score for r in all_behavior_results.values()]
-            overall_score = sum(scores) / len(scores)
+            overall_score = fmean(r.score for r in all_behavior_results.values())
             overall_passed = all(r.passed for r in all_behavior_results.values())
         else:
             overall_score = 0.0
@@ -164,7 +386,7 @@ class SecurityEvaluationEngine:
         return SecurityEngineResult(
             agent_type=self.adapter.get_name() if hasattr(self.adapter, "get_name") else "unknown",
             target=self.adapter.config.get("target", "unknown"),
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             overall_score=overall_score,
             overall_passed=overall_passed,
             behaviors=all_behavior_results,
@@ -177,61 +399,64 @@ class SecurityEvaluationEngine:
             },
         )
 
-    def _evaluate_behavior(
+    async def _evaluate_behavior_async(
         self,
         behavior_name: str,
         scenarios: list[dict[str, Any]],
         context: dict[str, Any],
+        connected: bool = True,
     ) -> SecurityEvaluationResult:
         """
         Evaluate a single behavior across scenarios.
 
+        Scenario prompts are sent concurrently over the adapter connection
+        held by the caller; the per-scenario fan-out is bounded by the
+        ``max_concurrent`` config key.
+
         Args:
             behavior_name: Behavior to evaluate
             scenarios: Scenarios to test
             context: Evaluation context
+            connected: Whether the caller's adapter connection succeeded
 
         Returns:
             Aggregated SecurityEvaluationResult
         """
-        all_evidence = []
-        all_patterns = []
-        scores = []
+        # Ring buffers: the report only ever shows the first items, so
+        # overflow is dropped in O(1) instead of retaining every scenario's
+        # evidence until the final slice.
+        all_evidence: deque[str] = deque(maxlen=20)
+        all_patterns: deque[dict[str, Any]] = deque(maxlen=10)
+        # Single-pass score accumulation instead of separate sum/min/max
+        # traversals at the end.
+        score_total = 0.0
+        score_min = float("inf")
+        score_max = float("-inf")
+        score_count = 0
         passed_count = 0
         static_results = []
         llm_results = []
 
-        for scenario in scenarios:
-            # Execute agent with scenario prompt
-            prompt = scenario.get("prompt", "")
-
-            try:
-                import asyncio
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                async def run():
-                    connected = await self.adapter.connect()
-                    if not connected:
-                        return None
-                    try:
-                        return await self.adapter.send_prompt(prompt, context)
-                    finally:
-                        await self.adapter.disconnect()
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrent", 20))
 
-                agent_output = loop.run_until_complete(run())
-                loop.close()
+        async def send(prompt: str) -> AgentOutput:
+            async with semaphore:
+                return await self._send_cached(behavior_name, prompt, context)
 
-                if agent_output is None:
-                    continue
+        outputs: list[Any] = []
+        if connected:
+            outputs = await asyncio.gather(
+                *(send(s.get("prompt", "")) for s in scenarios),
+                return_exceptions=True,
+            )
 
-            except Exception:
+        for agent_output in outputs:
+            if isinstance(agent_output, BaseException):
                 # Create empty output for failed execution
                 agent_output = AgentOutput()
 
             # Evaluate using security evaluator
-            eval_results = self.evaluator.evaluate(
+            eval_results = await self.evaluator.aevaluate(
                 agent_output=agent_output,
                 behavior_names=[behavior_name],
                 context=context,
@@ -241,7 +466,13 @@ class SecurityEvaluationEngine:
                 result = eval_results[behavior_name]
                 all_evidence.extend(result.evidence)
                 all_patterns.extend(result.pattern_matches)
-                scores.append(result.score)
+                score = result.score
+                score_total += score
+                score_count += 1
+                if score < score_min:
+                    score_min = score
+                if score > score_max:
+                    score_max = score
                 if result.passed:
                     passed_count += 1
                 if result.static_analysis:
@@ -250,42 +481,65 @@ class SecurityEvaluationEngine:
                     llm_results.append(result.llm_evaluation)
 
         # Aggregate results
-        avg_score = sum(scores) / len(scores) if scores else 0.0
+        avg_score = score_total / score_count if score_count else 0.0
         passed = passed_count == len(scenarios) if scenarios else True
 
-        behavior = create_behavior(behavior_name)
+        behavior = self._get_behavior(behavior_name)
 
         return SecurityEvaluationResult(
             behavior_name=behavior_name,
             passed=passed,
             score=avg_score,
-            evidence=all_evidence[:20],  # Limit evidence
+            evidence=list(all_evidence),
             severity=behavior.severity.value,
             static_analysis=static_results[0] if static_results else {},
             llm_evaluation=llm_results[0] if llm_results else {},
-            pattern_matches=all_patterns[:10],  # Limit patterns
+            pattern_matches=list(all_patterns),
             metadata={
                 "scenarios_tested": len(scenarios),
                 "scenarios_passed": passed_count,
-                "min_score": min(scores) if scores else 0.0,
-                "max_score": max(scores) if scores else 0.0,
+                "min_score": score_min if score_count else 0.0,
+                "max_score": score_max if score_count else 0.0,
             },
         )
 
-    def _generate_scenarios(
+    async def _generate_scenarios(
         self,
         behavior_names: list[str],
     ) -> list[dict[str, Any]]:
-        """Generate scenarios for behaviors."""
+        """Generate scenarios for behaviors.
+
+        Bloom's IdeationEngine is async, so the per-behavior generations
+        are gathered on the current loop and their LLM round-trips overlap
+        instead of queueing. Thread fan-out is deliberately avoided: each
+        worker would spin up its own event loop while sharing the single
+        module-global HTTP client, which is bound to one loop.
+        """
         try:
-            from superclaw.bloom import generate_scenarios
+            # Bind the Bloom ideation engine once per engine; the inline
+            # import re-ran the sys.modules lookup on every call.
+            if self._ideation_engine is None:
+                from superclaw.bloom.ideation import IdeationEngine
+
+                self._ideation_engine = IdeationEngine()
+
+            from superclaw.bloom.scenarios import BEHAVIOR_TEMPLATES
+
+            num_scenarios = self.config.get("scenarios_per_behavior", 3)
+            per_behavior = await asyncio.gather(
+                *(
+                    self._ideation_engine.agenerate(
+                        behavior=behavior_name,
+                        num_scenarios=num_scenarios,
+                        variation_dimensions=[],
+                        template=BEHAVIOR_TEMPLATES[behavior_name],
+                    )
+                    for behavior_name in behavior_names
+                )
+            )
 
             all_scenarios = []
-            for behavior_name in behavior_names:
-                scenarios = generate_scenarios(
-                    behavior=behavior_name,
-                    num_scenarios=self.config.get("scenarios_per_behavior", 3),
-                )
+            for behavior_name, scenarios in zip(behavior_names, per_behavior):
                 for s in scenarios:
                     s["behavior"] = behavior_name
                 all_scenarios.extend(scenarios)
@@ -304,7 +558,7 @@ class SecurityEvaluationEngine:
         scenarios = []
 
         for behavior_name in behavior_names:
-            behavior = create_behavior(behavior_name)
+            behavior = self._get_behavior(behavior_name)
 
             scenarios.append(
                 {
@@ -324,21 +578,20 @@ class SecurityEvaluationEngine:
         if not results:
             return {}
 
-        passed = sum(1 for r in results.values() if r.passed)
-        failed = len(results) - passed
-
-        # Count by severity
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        # One pass over the results covers both the pass count and the
+        # per-severity failure counts.
+        passed = 0
+        severity_counts = Counter()
         for result in results.values():
-            if not result.passed:
-                severity = result.severity.lower()
-                if severity in severity_counts:
-                    severity_counts[severity] += 1
+            if result.passed:
+                passed += 1
+            else:
+                severity_counts[result.severity.lower()] += 1
 
         return {
             "total_behaviors": len(results),
             "passed": passed,
-            "failed": failed,
+            "failed": len(results) - passed,
             "critical": severity_counts["critical"],
             "high": severity_counts["high"],
             "medium": severity_counts["medium"],
@@ -362,26 +615,41 @@ def create_security_engine(
     Returns:
         Configured SecurityEvaluationEngine
     """
-    llm_client = None
-
-    if llm_provider:
-        try:
-            from codeoptix.utils.llm import LLMProvider, create_llm_client
+    # No provider requested is the common CLI path: return before touching
+    # codeoptix, whose LLM subpackage drags in the provider SDKs.
+    if not llm_provider:
+        return SecurityEvaluationEngine(adapter=adapter, llm_client=None, config=config)
 
-            provider_map = {
-                "openai": LLMProvider.OPENAI,
-                "anthropic": LLMProvider.ANTHROPIC,
-                "google": LLMProvider.GOOGLE,
-                "ollama": LLMProvider.OLLAMA,
-            }
+    llm_client = None
+    try:
+        provider_map = _provider_map()
+        if llm_provider.lower() in provider_map:
+            from codeoptix.utils.llm import create_llm_client
 
-            if llm_provider.lower() in provider_map:
-                llm_client = create_llm_client(provider_map[llm_provider.lower()])
-        except ImportError:
-            pass
+            llm_client = create_llm_client(provider_map[llm_provider.lower()])
+    except ImportError:
+        pass
 
     return SecurityEvaluationEngine(
         adapter=adapter,
         llm_client=llm_client,
         config=config,
     )
+
+
+_PROVIDER_MAP: dict[str, Any] | None = None
+
+
+def _provider_map() -> dict[str, Any]:
+    """Build the provider-name to LLMProvider map once per process."""
+    global _PROVIDER_MAP
+    if _PROVIDER_MAP is None:
+        from codeoptix.utils.llm import LLMProvider
+
+        _PROVIDER_MAP = {
+            "openai": LLMProvider.OPENAI,
+            "anthropic": LLMProvider.ANTHROPIC,
+            "google": LLMProvider.GOOGLE,
+            "ollama": LLMProvider.OLLAMA,
+        }
+    return _PROVIDER_MAP
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+# libyaml's CSafeLoader parses several times faster than the pure-Python
+# loader; fall back when PyYAML was built without the C extension.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file, memoized until the file changes."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 @dataclass
 class Settings:
@@ -30,8 +42,10 @@ class Settings:
         return cls(
             target=data.get("default_target", data.get("target", cls.target)),
             agent_type=data.get("agent_type", cls.agent_type),
-            behaviors=data.get("behaviors", []),
-            techniques=data.get("techniques", []),
+            # Copy the lists: from_file feeds this a cached _load_yaml dict,
+            # and aliasing them would let Settings mutations pollute the cache.
+            behaviors=list(data.get("behaviors", [])),
+            techniques=list(data.get("techniques", [])),
             output_format=data.get("output_format", cls.output_format),
             log_level=data.get("logging", {}).get("level", data.get("log_level", cls.log_level)),
             safety_require_authorization=bool(safety.get("require_authorization", True)),
@@ -42,11 +56,32 @@ class Settings:
     @classmethod
     def from_file(cls, path: Path) -> Settings:
         """Load settings from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml(str(path), os.stat(path).st_mtime_ns)
         return cls.from_dict(data)
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() in {"1", "true", "yes"}
+
+
+def _split_csv(value: str) -> list[str]:
+    return value.split(",")
+
+
+# Environment overrides as (variable, Settings attribute, parser); one
+# table walk replaces a separate get/parse/assign block per variable.
+_ENV_MAP = (
+    ("SUPERCLAW_TARGET", "target", str),
+    ("SUPERCLAW_AGENT_TYPE", "agent_type", str),
+    ("SUPERCLAW_BEHAVIORS", "behaviors", _split_csv),
+    ("SUPERCLAW_TECHNIQUES", "techniques", _split_csv),
+    ("SUPERCLAW_OUTPUT_FORMAT", "output_format", str),
+    ("SUPERCLAW_LOG_LEVEL", "log_level", str),
+    ("SUPERCLAW_REQUIRE_AUTH", "safety_require_authorization", _parse_bool),
+    ("SUPERCLAW_LOCAL_ONLY", "safety_local_only", _parse_bool),
+    ("SUPERCLAW_MAX_CONCURRENT_ATTACKS", "safety_max_concurrent_attacks", int),
+)
+
 _settings: Settings | None = None
 
 
@@ -69,27 +104,12 @@ def get_settings() -> Settings:
     if config_file.exists():
         settings = Settings.from_file(config_file)
 
-    if target := os.environ.get("SUPERCLAW_TARGET"):
-        settings.target = target
-    if agent_type := os.environ.get("SUPERCLAW_AGENT_TYPE"):
-        settings.agent_type = agent_type
-    if behaviors := os.environ.get("SUPERCLAW_BEHAVIORS"):
-        settings.behaviors = behaviors.split(",")
-    if techniques := os.environ.get("SUPERCLAW_TECHNIQUES"):
-        settings.techniques = techniques.split(",")
-    if output_format := os.environ.get("SUPERCLAW_OUTPUT_FORMAT"):
-        settings.output_format = output_format
-    if log_level := os.environ.get("SUPERCLAW_LOG_LEVEL"):
-        settings.log_level = log_level
-    if require_auth := os.environ.get("SUPERCLAW_REQUIRE_AUTH"):
-        settings.safety_require_authorization = require_auth.lower() in {"1", "true", "yes"}
-    if local_only := os.environ.get("SUPERCLAW_LOCAL_ONLY"):
-        settings.safety_local_only = local_only.lower() in {"1", "true", "yes"}
-    if max_concurrent := os.environ.get("SUPERCLAW_MAX_CONCURRENT_ATTACKS"):
-        try:
-            settings.safety_max_concurrent_attacks = int(max_concurrent)
-        except ValueError:
-            pass
+    for env_var, attr, parse in _ENV_MAP:
+        if value := os.environ.get(env_var):
+            try:
+                setattr(settings, attr, parse(value))
+            except ValueError:
+                pass
 
     _settings = settings
     return settings
@@ -1,7 +1,4 @@
-from superclaw.reporting.base import ReportGenerator, generate_report
-from superclaw.reporting.html import HTMLReportGenerator
-from superclaw.reporting.json_report import JSONReportGenerator
-from superclaw.reporting.sarif import SARIFReportGenerator
+from typing import Any
 
 __all__ = [
     "generate_report",
@@ -10,3 +7,25 @@ __all__ = [
     "JSONReportGenerator",
     "SARIFReportGenerator",
 ]
+
+# PEP 562 lazy loading: importing superclaw.reporting no longer pulls in
+# every generator; each loads on first attribute use, so callers only pay
+# for the format they actually emit.
+_SUBMODULES = {
+    "generate_report": "base",
+    "ReportGenerator": "base",
+    "HTMLReportGenerator": "html",
+    "JSONReportGenerator": "json_report",
+    "SARIFReportGenerator": "sarif",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f"superclaw.reporting.{_SUBMODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
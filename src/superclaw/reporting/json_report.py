@@ -1,9 +1,11 @@
 """JSON report generator for security audit results."""
 
-import json
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+import orjson
+
 from superclaw.reporting.base import ReportGenerator
 
 
@@ -21,25 +23,34 @@ class JSONReportGenerator(ReportGenerator):
         """
         self._ensure_parent_dir(output)
 
-        report = self._build_report(results)
-
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=str)
-
-    def _build_report(self, results: dict[str, Any]) -> dict[str, Any]:
+        # One wall-clock read per report; subsections share the same stamp.
+        timestamp = datetime.now(UTC).isoformat()
+        report = self._build_report(results, timestamp)
+
+        # orjson encodes straight to bytes and indents several times
+        # faster than the stdlib encoder on multi-MB findings lists.
+        Path(output).write_bytes(
+            orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        )
+
+    def _build_report(self, results: dict[str, Any], timestamp: str) -> dict[str, Any]:
         """Build the complete JSON report structure."""
         return {
-            "metadata": self._build_metadata(results),
+            "metadata": self._build_metadata(results, timestamp),
             "summary": self._build_summary(results),
             "findings": results.get("findings", results.get("results", [])),
             "scenarios": results.get("scenarios", []),
         }
 
-    def _build_metadata(self, results: dict[str, Any]) -> dict[str, Any]:
+    def _build_metadata(self, results: dict[str, Any], timestamp: str) -> dict[str, Any]:
         """Build the metadata section of the report."""
         return {
             "version": self.VERSION,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp,
             "generator": "superclaw",
             "agent_type": results.get("agent_type", "unknown"),
             "target": results.get("target", "unknown"),
@@ -53,16 +64,21 @@ class JSONReportGenerator(ReportGenerator):
         if not isinstance(findings, list):
             findings = []
 
-        passed = sum(1 for f in findings if f.get("status") == "passed")
-        failed = sum(1 for f in findings if f.get("status") == "failed")
-        skipped = sum(1 for f in findings if f.get("status") == "skipped")
-
+        # One walk over the findings instead of three counting
+        # comprehensions plus a severity loop.
+        passed = failed = skipped = 0
         severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
         for f in findings:
-            if f.get("status") == "failed":
+            status = f.get("status")
+            if status == "passed":
+                passed += 1
+            elif status == "failed":
+                failed += 1
                 severity = f.get("severity", "medium").lower()
                 if severity in severity_counts:
                     severity_counts[severity] += 1
+            elif status == "skipped":
+                skipped += 1
 
         return {
             "total": len(findings),
@@ -1,12 +1,40 @@
 """SARIF 2.1.0 report generator for CI/CD integration."""
 
-import json
+import functools
+import hashlib
+import re
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+import orjson
+
 from superclaw.reporting.base import ReportGenerator
 
+# Rule-id sanitization: one C-level translate pass replaces the per-char
+# Python loop; runs of "-" are then collapsed by a precompiled regex.
+_RULE_ID_TRANS = str.maketrans(
+    {chr(c): "-" for c in range(128) if not (chr(c).isalnum() or chr(c) in "-_")}
+)
+_COLLAPSE = re.compile(r"-+")
+
+
+# Behaviors form a small finite set but repeat across every finding, so
+# both derivations are memoized for the life of the process.
+@functools.cache
+def _behavior_to_rule_id(behavior: str) -> str:
+    """Convert a behavior string to a SARIF rule ID."""
+    clean = behavior.lower().translate(_RULE_ID_TRANS)
+    clean = _COLLAPSE.sub("-", clean).strip("-")
+    return f"superclaw/{clean[:50]}"
+
+
+@functools.cache
+def _behavior_to_name(behavior: str) -> str:
+    """Convert a behavior string to a readable rule name."""
+    return behavior.replace("_", " ").replace("-", " ").title()[:100]
+
 
 class SARIFReportGenerator(ReportGenerator):
     """Generates SARIF 2.1.0 format reports for GitHub Code Scanning integration."""
@@ -39,19 +67,27 @@ class SARIFReportGenerator(ReportGenerator):
         """
         self._ensure_parent_dir(output)
 
-        sarif = self._build_sarif(results)
+        # One wall-clock read per report; subsections share the same stamp.
+        timestamp = datetime.now(UTC).isoformat()
+        sarif = self._build_sarif(results, timestamp)
 
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(sarif, f, indent=2)
+        # orjson encodes straight to bytes; SARIF is machine-consumed but
+        # stays indented for the humans who open it from CI artifacts.
+        Path(output).write_bytes(
+            orjson.dumps(sarif, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
 
-    def _build_sarif(self, results: dict[str, Any]) -> dict[str, Any]:
+    def _build_sarif(self, results: dict[str, Any], timestamp: str) -> dict[str, Any]:
         """Build the complete SARIF document."""
         findings = results.get("findings", results.get("results", []))
         if not isinstance(findings, list):
             findings = []
 
-        rules = self._build_rules(findings)
-        sarif_results = self._build_results(findings)
+        rules, sarif_results = self._build_rules_and_results(findings)
+
+        # One run identifier per report; findings carry content-derived
+        # fingerprints instead.
+        run_id = uuid4().hex[:8]
 
         return {
             "$schema": self.SARIF_SCHEMA,
@@ -70,64 +106,73 @@ class SARIFReportGenerator(ReportGenerator):
                     "invocations": [
                         {
                             "executionSuccessful": True,
-                            "endTimeUtc": datetime.now(UTC).isoformat(),
+                            "endTimeUtc": timestamp,
                         }
                     ],
                     "automationDetails": {
-                        "id": f"superclaw-audit-{uuid4().hex[:8]}",
+                        "id": f"superclaw-audit-{run_id}",
                         "description": {"text": "AI Agent Security Audit"},
                     },
                 }
             ],
         }
 
-    def _build_rules(self, findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Build SARIF rule definitions from findings."""
+    def _build_rules_and_results(
+        self, findings: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Build SARIF rule definitions and results in one pass.
+
+        Rules and results both key off the same per-finding rule id and
+        severity, so a single walk over the findings computes each once
+        instead of the former two-pass split.
+        """
         rules: dict[str, dict[str, Any]] = {}
+        sarif_results: list[dict[str, Any]] = []
+        severity_to_level = self.SEVERITY_TO_LEVEL
+        severity_to_security = self.SEVERITY_TO_SECURITY_SEVERITY
 
         for finding in findings:
             behavior = finding.get("behavior", "unknown")
-            rule_id = self._behavior_to_rule_id(behavior)
+            severity = finding.get("severity", "medium").lower()
+            rule_id = _behavior_to_rule_id(str(behavior))
 
             if rule_id not in rules:
-                severity = finding.get("severity", "medium").lower()
                 rules[rule_id] = {
                     "id": rule_id,
-                    "name": self._behavior_to_name(behavior),
+                    "name": _behavior_to_name(str(behavior)),
                     "shortDescription": {"text": str(behavior)},
                     "fullDescription": {"text": finding.get("description", str(behavior))},
-                    "defaultConfiguration": {
-                        "level": self.SEVERITY_TO_LEVEL.get(severity, "warning")
-                    },
+                    "defaultConfiguration": {"level": severity_to_level.get(severity, "warning")},
                     "properties": {
-                        "security-severity": self.SEVERITY_TO_SECURITY_SEVERITY.get(
-                            severity, "5.0"
-                        ),
+                        "security-severity": severity_to_security.get(severity, "5.0"),
                         "tags": ["security", "ai-agent", f"severity-{severity}"],
                     },
                     "helpUri": "https://github.com/superagentic/superclaw#behaviors",
                 }
 
-        return list(rules.values())
-
-    def _build_results(self, findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Build SARIF results from findings."""
-        sarif_results = []
-
-        for finding in findings:
             if finding.get("status") != "failed":
                 continue
 
-            behavior = finding.get("behavior", "unknown")
-            severity = finding.get("severity", "medium").lower()
             evidence = finding.get("evidence", "")
 
+            # Content-derived fingerprint: GitHub Code Scanning collapses
+            # recurring alerts by fingerprint, so a fresh uuid4 per run
+            # created duplicate alerts on every audit (and an urandom read
+            # per finding).
+            location = finding.get("location", {})
+            file_path = location.get("file", finding.get("file", "agent-interaction"))
+            line = finding.get("line", 1) if "line" not in location else location["line"]
+            fingerprint = hashlib.blake2b(
+                f"{rule_id}|{file_path}|{line}|{str(evidence)[:200]}".encode(),
+                digest_size=16,
+            ).hexdigest()
+
             result = {
-                "ruleId": self._behavior_to_rule_id(behavior),
-                "level": self.SEVERITY_TO_LEVEL.get(severity, "warning"),
+                "ruleId": rule_id,
+                "level": severity_to_level.get(severity, "warning"),
                 "message": {"text": self._build_message(finding)},
                 "locations": self._build_locations(finding),
-                "fingerprints": {"primaryLocationLineHash": uuid4().hex},
+                "fingerprints": {"primaryLocationLineHash": fingerprint},
             }
 
             if evidence:
@@ -137,7 +182,7 @@ class SARIFReportGenerator(ReportGenerator):
 
             sarif_results.append(result)
 
-        return sarif_results
+        return list(rules.values()), sarif_results
 
     def _build_message(self, finding: dict[str, Any]) -> str:
         """Build a descriptive message for a finding."""
@@ -172,14 +217,3 @@ class SARIFReportGenerator(ReportGenerator):
                 }
             }
         ]
-
-    def _behavior_to_rule_id(self, behavior: str) -> str:
-        """Convert a behavior string to a SARIF rule ID."""
-        clean = str(behavior).lower()
-        clean = "".join(c if c.isalnum() or c in "-_" else "-" for c in clean)
-        clean = "-".join(filter(None, clean.split("-")))
-        return f"superclaw/{clean[:50]}"
-
-    def _behavior_to_name(self, behavior: str) -> str:
-        """Convert a behavior string to a readable rule name."""
-        return str(behavior).replace("_", " ").replace("-", " ").title()[:100]
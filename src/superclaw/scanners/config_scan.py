@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+from collections import Counter
 from dataclasses import dataclass
 from ipaddress import ip_address, ip_network
 from pathlib import Path
@@ -10,6 +12,42 @@ from urllib.parse import urlparse
 
 import yaml
 
+# libyaml's CSafeLoader parses an order of magnitude faster than the
+# pure-Python loader while keeping safe_load semantics; fall back when
+# PyYAML was built without the C extension.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Top-level sections the scanner actually reads; everything else in the
+# document is parsed but never turned into Python objects.
+_WANTED_TOP_KEYS = frozenset({"default_target", "target", "safety", "llm", "logging", "auth"})
+
+
+def _load_wanted_sections(stream: Any) -> Any:
+    """Load only the top-level config sections the scanner reads.
+
+    The parser still tokenizes the whole document (in C with libyaml),
+    but object construction — the Python-level phase that dominates for
+    large documents — runs only for whitelisted keys, so configs that
+    embed big unrelated blocks stay cheap. Non-mapping documents fall
+    back to full construction, matching yaml.load semantics.
+    """
+    loader = _YAML_LOADER(stream)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None
+        if not isinstance(node, yaml.MappingNode):
+            return loader.construct_document(node)
+        data: dict[str, Any] = {}
+        for key_node, value_node in node.value:
+            key = loader.construct_object(key_node)
+            if key in _WANTED_TOP_KEYS:
+                data[key] = loader.construct_object(value_node, deep=True)
+        return data
+    finally:
+        loader.dispose()
+
+
 PRIVATE_NETWORKS = [
     ip_network("10.0.0.0/8"),
     ip_network("172.16.0.0/12"),
@@ -18,10 +56,20 @@ PRIVATE_NETWORKS = [
     ip_network("::1/128"),
 ]
 
+# (network, netmask) as plain integers, split by family: membership then
+# reduces to one mask-and-compare per network instead of ip_network's
+# Python-level containment arithmetic.
+_PRIVATE_V4 = [(int(n.network_address), int(n.netmask)) for n in PRIVATE_NETWORKS if n.version == 4]
+_PRIVATE_V6 = [(int(n.network_address), int(n.netmask)) for n in PRIVATE_NETWORKS if n.version == 6]
+
 
 @dataclass
 class ScanFinding:
-    """Single config scan finding."""
+    """Single config scan finding.
+
+    Kept as the public shape of a finding; the scan itself builds plain
+    dicts directly since every finding is immediately serialized.
+    """
 
     rule: str
     severity: str
@@ -38,72 +86,83 @@ class ScanFinding:
 
 
 def scan_config(path: Path) -> dict[str, Any]:
-    """Scan a SuperClaw config file for risky settings."""
+    """Scan a SuperClaw config file for risky settings.
+
+    Results are memoized per (path, mtime, size), so repeated scans of an
+    unchanged file — watch loops, multi-format report runs — skip the
+    YAML parse and check phase entirely. Editing the file invalidates
+    the entry via its new mtime.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
+    stat = path.stat()
+    cached = _scan_config_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    # Hand each caller its own copy; scan results are plain dicts that
+    # callers are free to annotate or mutate.
+    summary = cached["summary"]
+    return {
+        "findings": [dict(finding) for finding in cached["findings"]],
+        "summary": {"total": summary["total"], "severity": dict(summary["severity"])},
+        "config_path": cached["config_path"],
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_config_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    path = Path(path_str)
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = _load_wanted_sections(f) or {}
 
-    findings: list[ScanFinding] = []
+    findings: list[dict[str, Any]] = []
 
     target = data.get("default_target") or data.get("target")
     if target:
         findings.extend(_check_target(target))
     else:
         findings.append(
-            ScanFinding(
-                rule="missing_default_target",
-                severity="low",
-                message="No default target configured.",
-                remediation="Set default_target to a local gateway URL.",
-            )
+            {
+                "rule": "missing_default_target",
+                "severity": "low",
+                "message": "No default target configured.",
+                "remediation": "Set default_target to a local gateway URL.",
+            }
         )
 
-    safety = data.get("safety", {})
-    findings.extend(_check_safety(safety))
-
-    llm = data.get("llm", {})
-    findings.extend(_check_llm(llm))
-
-    logging = data.get("logging", {})
-    findings.extend(_check_logging(logging))
-
-    auth = data.get("auth", {})
-    findings.extend(_check_auth(auth))
+    _simple_checks(data, findings.append)
 
     summary = _summarize(findings)
     return {
-        "findings": [f.to_dict() for f in findings],
+        "findings": findings,
         "summary": summary,
         "config_path": str(path),
     }
 
 
-def _check_target(target: str) -> list[ScanFinding]:
-    findings: list[ScanFinding] = []
+def _check_target(target: str) -> list[dict[str, Any]]:
+    findings: list[dict[str, Any]] = []
     parsed = urlparse(target)
     host = parsed.hostname
     scheme = parsed.scheme
 
     if scheme not in {"ws", "wss"}:
         findings.append(
-            ScanFinding(
-                rule="target_scheme",
-                severity="medium",
-                message=f"Target scheme '{scheme}' is not ws:// or wss://.",
-                remediation="Use ws:// for local testing or wss:// for remote targets.",
-            )
+            {
+                "rule": "target_scheme",
+                "severity": "medium",
+                "message": f"Target scheme '{scheme}' is not ws:// or wss://.",
+                "remediation": "Use ws:// for local testing or wss:// for remote targets.",
+            }
         )
 
     if not host:
         findings.append(
-            ScanFinding(
-                rule="target_host_missing",
-                severity="high",
-                message="Target host is missing or invalid.",
-                remediation="Set default_target to a valid host (e.g., ws://127.0.0.1:18789).",
-            )
+            {
+                "rule": "target_host_missing",
+                "severity": "high",
+                "message": "Target host is missing or invalid.",
+                "remediation": "Set default_target to a valid host (e.g., ws://127.0.0.1:18789).",
+            }
         )
         return findings
 
@@ -112,169 +171,203 @@ def _check_target(target: str) -> list[ScanFinding]:
 
     if host in {"0.0.0.0", "::"}:
         findings.append(
-            ScanFinding(
-                rule="target_bind_all",
-                severity="high",
-                message=f"Target host '{host}' binds to all interfaces.",
-                remediation="Bind the gateway to localhost or a private interface.",
-            )
+            {
+                "rule": "target_bind_all",
+                "severity": "high",
+                "message": f"Target host '{host}' binds to all interfaces.",
+                "remediation": "Bind the gateway to localhost or a private interface.",
+            }
         )
         return findings
 
-    if _is_private_ip(host):
+    # Only digit-leading or colon-bearing hosts can be IP literals, so
+    # plain DNS names skip the private-IP helper entirely.
+    if (host[:1].isdigit() or ":" in host) and _is_private_ip(host):
         return findings
 
     findings.append(
-        ScanFinding(
-            rule="target_public",
-            severity="high",
-            message=f"Target host '{host}' appears to be public.",
-            remediation="Use a VPN or bind the gateway to localhost to avoid exposure.",
-        )
+        {
+            "rule": "target_public",
+            "severity": "high",
+            "message": f"Target host '{host}' appears to be public.",
+            "remediation": "Use a VPN or bind the gateway to localhost to avoid exposure.",
+        }
     )
 
     if scheme == "ws":
         findings.append(
-            ScanFinding(
-                rule="target_insecure_ws",
-                severity="medium",
-                message="Using ws:// with a non-local target.",
-                remediation="Use wss:// for remote targets.",
-            )
-        )
-
-    return findings
-
-
-def _check_safety(safety: dict[str, Any]) -> list[ScanFinding]:
-    findings: list[ScanFinding] = []
-
-    require_auth = safety.get("require_authorization", True)
-    if not require_auth:
-        findings.append(
-            ScanFinding(
-                rule="require_authorization_disabled",
-                severity="high",
-                message="Safety.require_authorization is disabled.",
-                remediation="Set safety.require_authorization to true.",
-            )
+            {
+                "rule": "target_insecure_ws",
+                "severity": "medium",
+                "message": "Using ws:// with a non-local target.",
+                "remediation": "Use wss:// for remote targets.",
+            }
         )
 
-    local_only = safety.get("local_only", True)
-    if not local_only:
-        findings.append(
-            ScanFinding(
-                rule="local_only_disabled",
-                severity="medium",
-                message="Safety.local_only is disabled.",
-                remediation="Set safety.local_only to true for local testing.",
-            )
-        )
-
-    max_concurrent = safety.get("max_concurrent_attacks")
-    if isinstance(max_concurrent, int):
-        if max_concurrent <= 0:
-            findings.append(
-                ScanFinding(
-                    rule="max_concurrent_attacks_invalid",
-                    severity="medium",
-                    message="Safety.max_concurrent_attacks is set to 0 or below.",
-                    remediation="Set max_concurrent_attacks to a positive integer.",
-                )
-            )
-        elif max_concurrent > 20:
-            findings.append(
-                ScanFinding(
-                    rule="max_concurrent_attacks_high",
-                    severity="low",
-                    message=f"Safety.max_concurrent_attacks is high ({max_concurrent}).",
-                    remediation="Reduce concurrency to avoid overwhelming targets.",
-                )
-            )
-
-    return findings
-
-
-def _check_llm(llm: dict[str, Any]) -> list[ScanFinding]:
-    findings: list[ScanFinding] = []
-    provider = str(llm.get("provider", "")).strip()
-    if not provider:
-        findings.append(
-            ScanFinding(
-                rule="llm_provider_missing",
-                severity="low",
-                message="LLM provider is not configured.",
-                remediation="Set llm.provider to openai, anthropic, google, or ollama.",
-            )
-        )
-    model = str(llm.get("model", "")).strip()
-    if not model:
-        findings.append(
-            ScanFinding(
-                rule="llm_model_missing",
-                severity="low",
-                message="LLM model is not configured.",
-                remediation="Set llm.model to a valid model ID.",
-            )
-        )
-    return findings
-
-
-def _check_logging(logging: dict[str, Any]) -> list[ScanFinding]:
-    findings: list[ScanFinding] = []
-    level = str(logging.get("level", "INFO")).strip().upper()
-    if level in {"", "OFF", "NONE"}:
-        findings.append(
-            ScanFinding(
-                rule="logging_disabled",
-                severity="low",
-                message="Logging appears to be disabled.",
-                remediation="Set logging.level to INFO or DEBUG during audits.",
-            )
-        )
-    log_file = str(logging.get("file", "")).strip()
-    if not log_file:
-        findings.append(
-            ScanFinding(
-                rule="logging_file_missing",
-                severity="low",
-                message="Logging file path is not configured.",
-                remediation="Set logging.file to a local path for audit trails.",
-            )
-        )
     return findings
 
 
-def _check_auth(auth: dict[str, Any]) -> list[ScanFinding]:
-    findings: list[ScanFinding] = []
-    if auth.get("token") or auth.get("password"):
-        findings.append(
-            ScanFinding(
-                rule="auth_secrets_in_config",
-                severity="medium",
-                message="Auth secrets are stored in the config file.",
-                remediation="Prefer environment variables for secrets.",
-            )
-        )
-    return findings
-
-
-def _summarize(findings: list[ScanFinding]) -> dict[str, Any]:
-    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    for finding in findings:
-        if finding.severity in severity_counts:
-            severity_counts[finding.severity] += 1
-
+def _norm(value: Any) -> str:
+    """Strip a config value without re-wrapping values already str."""
+    return (value if isinstance(value, str) else str(value)).strip()
+
+
+# The per-section checks have a fixed schema, so instead of four
+# functions doing dict.get/compare/append per call, one straight-line
+# checker is generated at import: each rule becomes an inline predicate
+# guarding a prebuilt finding dict. Predicates are exec-compiled from
+# this table; findings are shallow-copied on append so callers may
+# mutate results. Entries with a message expression format it from the
+# matched value (bound via walrus in the predicate).
+_SIMPLE_CHECKS: tuple[tuple[str, str, dict[str, str], str | None], ...] = (
+    (
+        "safety",
+        'not sec.get("require_authorization", True)',
+        {
+            "rule": "require_authorization_disabled",
+            "severity": "high",
+            "message": "Safety.require_authorization is disabled.",
+            "remediation": "Set safety.require_authorization to true.",
+        },
+        None,
+    ),
+    (
+        "safety",
+        'not sec.get("local_only", True)',
+        {
+            "rule": "local_only_disabled",
+            "severity": "medium",
+            "message": "Safety.local_only is disabled.",
+            "remediation": "Set safety.local_only to true for local testing.",
+        },
+        None,
+    ),
+    (
+        "safety",
+        'isinstance(_mc := sec.get("max_concurrent_attacks"), int) and _mc <= 0',
+        {
+            "rule": "max_concurrent_attacks_invalid",
+            "severity": "medium",
+            "message": "Safety.max_concurrent_attacks is set to 0 or below.",
+            "remediation": "Set max_concurrent_attacks to a positive integer.",
+        },
+        None,
+    ),
+    (
+        "safety",
+        'isinstance(_mc := sec.get("max_concurrent_attacks"), int) and _mc > 20',
+        {
+            "rule": "max_concurrent_attacks_high",
+            "severity": "low",
+            "message": "",
+            "remediation": "Reduce concurrency to avoid overwhelming targets.",
+        },
+        'f"Safety.max_concurrent_attacks is high ({_mc})."',
+    ),
+    (
+        "llm",
+        'not _norm(sec.get("provider", ""))',
+        {
+            "rule": "llm_provider_missing",
+            "severity": "low",
+            "message": "LLM provider is not configured.",
+            "remediation": "Set llm.provider to openai, anthropic, google, or ollama.",
+        },
+        None,
+    ),
+    (
+        "llm",
+        'not _norm(sec.get("model", ""))',
+        {
+            "rule": "llm_model_missing",
+            "severity": "low",
+            "message": "LLM model is not configured.",
+            "remediation": "Set llm.model to a valid model ID.",
+        },
+        None,
+    ),
+    (
+        "logging",
+        '_norm(sec.get("level", "INFO")).upper() in {"", "OFF", "NONE"}',
+        {
+            "rule": "logging_disabled",
+            "severity": "low",
+            "message": "Logging appears to be disabled.",
+            "remediation": "Set logging.level to INFO or DEBUG during audits.",
+        },
+        None,
+    ),
+    (
+        "logging",
+        'not _norm(sec.get("file", ""))',
+        {
+            "rule": "logging_file_missing",
+            "severity": "low",
+            "message": "Logging file path is not configured.",
+            "remediation": "Set logging.file to a local path for audit trails.",
+        },
+        None,
+    ),
+    (
+        "auth",
+        'sec.get("token") or sec.get("password")',
+        {
+            "rule": "auth_secrets_in_config",
+            "severity": "medium",
+            "message": "Auth secrets are stored in the config file.",
+            "remediation": "Prefer environment variables for secrets.",
+        },
+        None,
+    ),
+)
+
+
+def _compile_simple_checks():
+    """Generate the specialized checker function from _SIMPLE_CHECKS."""
+    lines = ["def _simple_checks(data, append):"]
+    section = None
+    for index, (sec_name, predicate, _finding, message) in enumerate(_SIMPLE_CHECKS):
+        if sec_name != section:
+            lines.append(f'    sec = data.get("{sec_name}", {{}})')
+            section = sec_name
+        lines.append(f"    if {predicate}:")
+        if message is None:
+            lines.append(f"        append(dict(_FINDINGS[{index}]))")
+        else:
+            lines.append(f"        finding = dict(_FINDINGS[{index}])")
+            lines.append(f'        finding["message"] = {message}')
+            lines.append("        append(finding)")
+    namespace = {"_FINDINGS": [finding for _, _, finding, _ in _SIMPLE_CHECKS], "_norm": _norm}
+    exec("\n".join(lines), namespace)
+    return namespace["_simple_checks"]
+
+
+_simple_checks = _compile_simple_checks()
+
+
+def _summarize(findings: list[dict[str, Any]]) -> dict[str, Any]:
+    # Counter consumes the generator in C; unknown severities fall out
+    # naturally when projecting onto the fixed key set.
+    counts = Counter(finding["severity"] for finding in findings)
     return {
         "total": len(findings),
-        "severity": severity_counts,
+        "severity": {key: counts.get(key, 0) for key in ("critical", "high", "medium", "low")},
     }
 
 
+@functools.lru_cache(maxsize=1024)
 def _is_private_ip(host: str) -> bool:
+    # DNS hostnames are the common case; a leading letter (outside IPv6
+    # colon notation) can never be an IP literal, so skip the ValueError
+    # raise/catch that otherwise dominates this check.
+    if not host or (host[0].isalpha() and ":" not in host):
+        return False
+
     try:
         ip = ip_address(host)
     except ValueError:
         return False
 
-    return any(ip in network for network in PRIVATE_NETWORKS)
+    value = int(ip)
+    table = _PRIVATE_V4 if ip.version == 4 else _PRIVATE_V6
+    return any((value & mask) == network for network, mask in table)